@@ -0,0 +1,80 @@
+"""
+Micro-benchmark of TranslatedField getter: per-access regex (legacy to_attribute)
+against precomputed FieldPlan lookup. Column resolution is measured separately,
+full getter also includes get_language() which costs the same for both.
+
+    python benchmarks/plan_lookup.py
+"""
+
+import os
+import re
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / 'testapp')]
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.utils.translation import get_language, override  # noqa: E402
+
+from testapp.models import Question  # noqa: E402
+
+
+OBJECTS = 10_000
+REPEAT = 5
+
+
+def legacy_getter(obj, name='question', field=Question.question):
+    language = get_language() or field.attr_suffix[0]
+    return getattr(obj, re.sub(r"[^a-z0-9_]+", "_", (f"{name}_{language}").lower()))
+
+
+def main():
+
+    objs = [
+        Question(question_en_us=f'q{i}', question_ru=f'в{i}', question_de=f'f{i}')
+        for i in range(OBJECTS)
+    ]
+
+    columns = Question.question.plan.columns
+
+    def resolve_legacy():
+        for _ in objs:
+            re.sub(r"[^a-z0-9_]+", "_", ("question_ru").lower())
+
+    def resolve_plan():
+        for _ in objs:
+            columns.get('ru')
+
+    def read_legacy():
+        for obj in objs:
+            legacy_getter(obj)
+
+    def read_plan():
+        for obj in objs:
+            obj.question
+
+    def best(fn):
+        return min(timeit.repeat(fn, number=1, repeat=REPEAT))
+
+    with override('ru'):
+        results = {
+            'column resolution': (best(resolve_legacy), best(resolve_plan)),
+            'getter': (best(read_legacy), best(read_plan)),
+        }
+
+    print(f'{OBJECTS} reads, best of {REPEAT}')
+    for title, (legacy, plan) in results.items():
+        print(
+            f'{title:<18} regex: {legacy * 1000:7.2f} ms  '
+            f'plan: {plan * 1000:7.2f} ms  ({legacy / plan:.1f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,21 +1,41 @@
-# TODO: Добавить общий игнор.
-try:
-    import django  # noqa
-except ModuleNotFoundError:  # pragma: no cover
-    pass
-else:
-    from .fields import TranslatedField  # noqa
-    from .bases import ExtendField, ExtendMetaBase, ConverterMixin, AutoConvert  # noqa
-    from .opportunity import (  # noqa
-        TextResultModel,
-        DeeplTranslator,
-        get_translator,
-        LangsModel,
-        BatchLangsModel,
-        AWSLangsModel,
-        AWSBatchLangsModel,
-        AWSLanguageDetector,
-        get_detector,
-    )
-    from .validators import Validator  # noqa
-    from .exceptions import UndefinedMethodError  # noqa
+from importlib import import_module
+
+# Public names are imported on first access (PEP 562): "import extends" does not
+# load django models machinery, deepl, botocore or pydantic.
+_LAZY_ATTRS = {
+    '.fields': ('TranslatedField',),
+    '.bases': ('ExtendField', 'ExtendMetaBase', 'ConverterMixin', 'AutoConvert', 'LazyConverter'),
+    '.opportunity': (
+        'TextResultModel',
+        'DeeplTranslator',
+        'get_translator',
+        'LangsModel',
+        'BatchLangsModel',
+        'AWSLangsModel',
+        'AWSBatchLangsModel',
+        'AWSLanguageDetector',
+        'get_detector',
+        'MemoryCache',
+        'CachedTranslator',
+        'cached',
+    ),
+    '.validators': ('Validator',),
+    '.exceptions': ('UndefinedMethodError',),
+    '.observers': ('register_observer', 'unregister_observer', 'StatsObserver'),
+}
+_MODULES = {name: module for module, names in _LAZY_ATTRS.items() for name in names}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+
+    if name not in _MODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
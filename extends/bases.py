@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from inspect import isclass
+from threading import Lock
 from abc import ABC, abstractmethod
-from typing import Callable, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Any, Mapping, NamedTuple
 from collections import namedtuple
 from contextvars import ContextVar
 from contextlib import contextmanager
@@ -10,10 +14,12 @@ from django.db.models.fields import Field
 from django.utils.functional import lazy
 from django.utils.text import capfirst
 from django.db.models.manager import Manager
-from pydantic import BaseModel
 
 from .validators import Validator, ValidatorsFabric
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
 
 _show_suffix = ContextVar("show_suffix")
 
@@ -25,6 +31,29 @@ def show_suffix(show):
     _show_suffix.reset(token)
 
 
+class FieldPlan(NamedTuple):
+    """Column names of ExtendField precomputed on class creation."""
+
+    name: str
+    columns: Mapping[str, str]  # language code or suffix -> column
+    suffixes: Mapping[str, str]  # column -> suffix
+    fallbacks: Mapping[str, tuple[str, ...]] = MappingProxyType({})  # language -> columns
+
+
+class ModelPlan(NamedTuple):
+    """Plans of every ExtendField descriptor of the model."""
+
+    descriptors: frozenset[str]
+    fields: Mapping[str, FieldPlan]  # descriptor name -> field plan
+    columns: Mapping[str, str]  # column -> descriptor name
+
+
+def _language_variants(code: str) -> set[str]:
+    # get_language() returns "en-us" when suffix may be declared as "en_us" and so on.
+    lower = code.lower()
+    return {code, lower, lower.replace('_', '-'), lower.replace('-', '_')}
+
+
 class AbstractExtendField(ABC):
 
     @abstractmethod
@@ -44,23 +73,49 @@ class AutoConvert:
         self.suffix = suffix
 
 
-class ConverterMixin:
+class LazyConverter:
+    """
+    Converter factory called on first use, not at model class creation: model
+    import, migrations and checks never build api clients.
+    """
 
-    def _create_auto_property(self, converter_data) -> None:
+    def __init__(self, factory: Callable[[], Any]) -> None:
 
-        self._auto = True
+        self.factory = factory
+        self._converter = None
+        self._lock = Lock()
 
-        def fget(self):
+    def resolve(self) -> Any:
 
-            if hasattr(self, '_auto'):
-                if conv := converter_data[0] or getattr(self, 'converter', None):
-                    return AutoConvert(conv, converter_data[1])
-                raise AttributeError(
-                    'Converter does not exists. Specify converter object'
-                    ' in auto params or ExtendMeta attr.'
-                )
+        if self._converter is None:
+            with self._lock:
+                if self._converter is None:
+                    self._converter = self.factory()
+        return self._converter
 
-        setattr(self.__class__, 'auto', property(fget=fget))
+
+class ConverterMixin:
+
+    def _create_auto_property(self, converter_data) -> None:
+
+        self._auto = True
+        # Keep converter data on the field instance: every auto field of the
+        # model may have its own converter and suffix list.
+        self._converter_data = converter_data
+
+    @property
+    def auto(self):
+
+        if hasattr(self, '_auto'):
+            converter_data = self._converter_data
+            if conv := converter_data[0] or getattr(self, 'converter', None):
+                if isinstance(conv, LazyConverter):
+                    conv = conv.resolve()
+                return AutoConvert(conv, converter_data[1])
+            raise AttributeError(
+                'Converter does not exists. Specify converter object'
+                ' in auto params or ExtendMeta attr.'
+            )
 
 
 class ExtendField(AbstractExtendField):
@@ -71,11 +126,14 @@ class ExtendField(AbstractExtendField):
         specific=None,
         *,
         attr_suffix=None,
+        fallback=None,
     ) -> None:
 
         self._field = field
         self._specific = specific or {}
         self.attr_suffix = attr_suffix
+        # {language: [fallback languages]}, used when language column is empty.
+        self.fallback = fallback
 
         self.creation_counter = Field.creation_counter
         Field.creation_counter += len(self.attr_suffix)
@@ -97,6 +155,7 @@ class ExtendField(AbstractExtendField):
     def contribute_to_class(self, model_cls: Model, name: str) -> None:
 
         _n, _p, args, kwargs = self._field.deconstruct()
+        self.model = model_cls
         self.attrname = name
         fields = []
         verbose_name = kwargs.pop("verbose_name", name)
@@ -115,6 +174,40 @@ class ExtendField(AbstractExtendField):
 
         self.fields = fields
         self.short_description = verbose_name
+        self.plan = self._create_plan(name)
+
+    def _create_plan(self, name: str) -> FieldPlan:
+
+        columns, suffixes, fallbacks = {}, {}, {}
+        for suffix, column in zip(self.attr_suffix, self.fields):
+            suffixes[column] = suffix
+            for code in _language_variants(suffix):
+                columns.setdefault(code, column)
+
+        for language, chain in (self.fallback or {}).items():
+            chain_columns = [columns.get(language)]
+            chain_columns.extend(columns.get(code) for code in chain)
+            if None in chain_columns:
+                raise ValueError(
+                    f'{name} fallback {language}: {chain} refer to undeclared language. '
+                    f'Declared languages are {self.attr_suffix}.'
+                )
+            for code in _language_variants(language):
+                fallbacks[code] = tuple(dict.fromkeys(chain_columns))
+
+        return FieldPlan(
+            name,
+            MappingProxyType(columns),
+            MappingProxyType(suffixes),
+            MappingProxyType(fallbacks),
+        )
+
+    def column_for(self, language: str | None = None) -> str:
+        """Column of language by plan, to_attribute is called for unknown languages only."""
+
+        if (column := self.plan.columns.get(language)) is not None:
+            return column
+        return self.to_attribute(self.attrname, language)
 
 
 class ExtendFieldDescriptor(ExtendField):
@@ -128,9 +221,10 @@ class ExtendFieldDescriptor(ExtendField):
         attrgetter=None,
         attrsetter=None,
         validators=None,
+        fallback=None,
     ) -> None:
 
-        super().__init__(field, specific, attr_suffix=attr_suffix)
+        super().__init__(field, specific, attr_suffix=attr_suffix, fallback=fallback)
 
         self._attrgetter = attrgetter
         self._attrsetter = attrsetter
@@ -165,6 +259,10 @@ class ExtendMetaBase:
 
     override_query: bool = False
     converter: Callable[[str, str], str] | object | None = None
+    # Default manager querysets load active language columns only.
+    current_language_only: bool = False
+    # Fallback chains {language: [languages]} for fields without own fallback.
+    fallback: dict[str, list[str]] | None = None
 
 
 class ExtendModelOptions:
@@ -211,6 +309,8 @@ class ExtendModelOptions:
                     manag for manag in opts.local_managers if manag.name != 'objects'
                 ]
             setattr(m, 'orm_proxy', orm_proxy)
+            extend_meta = cls.models_data[model_cls]['extend_meta']
+            setattr(m, 'current_language_default', extend_meta.meta.current_language_only)
             m.contribute_to_class(model_cls, 'objects')
             warning_message(f'Override django "objects" manager for {model_cls}.')
             return
@@ -275,13 +375,36 @@ class ExtendModelOptions:
         if extend_meta and extend_meta.meta.converter:
             try:
                 if conv := extend_meta.meta.converter.get(extend_obj.attrname):
-                    setattr(extend_obj, 'converter', conv())
+                    setattr(extend_obj, 'converter', LazyConverter(conv))
             except AttributeError:
                 raise AttributeError(
                     'ExtendMeta converter attribute must be dict instance, '
                     'where keys are fields names for which will be set converter.'
                 )
 
+        if extend_meta and extend_meta.meta.fallback and extend_obj.fallback is None:
+            extend_obj.fallback = extend_meta.meta.fallback
+            extend_obj.plan = extend_obj._create_plan(extend_obj.attrname)
+
         if hasattr(opts, "extend_descriptor"):
             cls._set_descriptor_to_django_model_meta(model_cls)
             opts.extend_descriptor[extend_field] = extend_obj
+
+        cls._set_model_plan(opts, extend_obj)
+
+    @staticmethod
+    def _set_model_plan(opts, extend_obj: ExtendField) -> None:
+
+        plan = getattr(opts, 'extend_plan', None)
+        fields = {**(plan.fields if plan else {}), extend_obj.attrname: extend_obj.plan}
+        opts.extend_plan = ModelPlan(
+            descriptors=frozenset(fields),
+            fields=MappingProxyType(fields),
+            columns=MappingProxyType(
+                {
+                    column: name
+                    for name, field_plan in fields.items()
+                    for column in field_plan.suffixes
+                }
+            ),
+        )
@@ -1 +1,13 @@
-from .translated_field import TranslatedField, to_attribute  # noqa
+from .translated_field import (  # noqa
+    TranslatedField,
+    to_attribute,
+    translate_pending,
+    atranslate_pending,
+    defer_translation,
+    enqueue_pending,
+    enqueue_rows,
+    IMMEDIATE,
+    DEFERRED,
+    BACKGROUND,
+)
+from .expressions import Translated  # noqa
@@ -0,0 +1,36 @@
+from django.db.models import Expression
+
+
+class Translated(Expression):
+    """
+    Effective translation of TranslatedField in queries, fallback chain is compiled
+    to Coalesce(NullIf(col_de, ''), col_en_us) when query model is known:
+
+        Question.objects.annotate(q=Translated('question')).order_by('q')
+        Question.objects.order_by(Translated('question', 'de').desc())
+    """
+
+    def __init__(self, name: str, language: str | None = None) -> None:
+
+        super().__init__()
+        self.name = name
+        self.language = language
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.name!r}, {self.language!r})'
+
+    def resolve_expression(
+        self,
+        query=None,
+        allow_joins=True,
+        reuse=None,
+        summarize=False,
+        for_save=False,
+    ):
+        plan = getattr(query.model._meta, 'extend_plan', None)
+        if not plan or self.name not in plan.descriptors:
+            raise ValueError(f'{query.model} has not TranslatedField {self.name}.')
+        desc = getattr(query.model, self.name)
+        return desc.effective_expression(self.language).resolve_expression(
+            query, allow_joins, reuse, summarize, for_save
+        )
@@ -1,50 +1,387 @@
 import re
-from typing import Callable, Any
+import asyncio
+import hashlib
+from threading import Lock
+from functools import lru_cache
+from contextvars import ContextVar, copy_context
+from contextlib import contextmanager
+from typing import Callable, Any, Iterable
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from django.utils.translation import get_language
-from django.db.models import Model
+from django.db.models import Model, Expression, F, Q, Value, CharField
+from django.db.models.functions import Coalesce, NullIf
+from django.db.models.signals import pre_save, post_save
 from django.db.models.fields import Field
 from django.conf import settings
+from asgiref.sync import sync_to_async
 
-from extends.bases import ExtendFieldDescriptor, ExtendModelOptions, ConverterMixin
+from extends.bases import ExtendFieldDescriptor, ExtendModelOptions, ConverterMixin, LazyConverter
+from extends.opportunity.bases import source_kwargs
+from extends.opportunity.exceptions import TranslatorTimeoutError
+from extends.observers import observe, observe_context
 
 
-def to_attribute(name, language_code=None):
-    language = language_code or get_language()
+# Auto translation modes.
+IMMEDIATE = 'immediate'
+DEFERRED = 'deferred'
+BACKGROUND = 'background'
+
+AUTO_MODES = (IMMEDIATE, DEFERRED, BACKGROUND)
+
+# Instance attribute with {name: (source value, source suffix, mode)} recorded
+# by deferred and background setters.
+PENDING_ATTR = '_translation_pending'
+# Instance attribute with {name: source hash} of translated values, used when
+# field has not hidden source hash column.
+SOURCE_HASHES_ATTR = '_translation_source_hashes'
+
+_defer_translation = ContextVar("defer_translation")
+
+
+@contextmanager
+def defer_translation(defer=True):
+    """Make setters of IMMEDIATE fields work as DEFERRED, for bulk objects building."""
+    token = _defer_translation.set(defer)
+    try:
+        yield
+    finally:
+        _defer_translation.reset(token)
+
+
+@lru_cache(maxsize=1024)
+def _to_attribute(name, language):
     return re.sub(r"[^a-z0-9_]+", "_", (f"{name}_{language}").lower())
 
 
+def to_attribute(name, language_code=None):
+    return _to_attribute(name, language_code or get_language())
+
+
 def translated_attrgetter(name, field):
-    return lambda self: getattr(self, to_attribute(name, get_language() or field.attr_suffix[0]))
+
+    def _getter(self):
+        language = get_language() or field.attr_suffix[0]
+        # Plan dict lookup, to_attribute is called only for undeclared languages.
+        column = field.plan.columns.get(language) or field.column_for(language)
+        if column not in self.__dict__ and self.pk is not None:
+            # Column was deferred (current_language_only) and language was switched:
+            # load all deferred languages of the field with one query, not one per language.
+            self.refresh_from_db(fields=[c for c in field.fields if c not in self.__dict__])
+        value = getattr(self, column)
+        if (value is None or value == '') and (chain := field.plan.fallbacks.get(language)):
+            for fallback_column in chain[1:]:
+                value = getattr(self, fallback_column)
+                if value is not None and value != '':
+                    break
+        return value
+
+    return _getter
+
+
+def translate_suffixes(
+    field, value: str, suffixes: list[str], source_lang: str | None = None
+) -> dict[str, str]:
+    """Translate value to every suffix, on field thread pool if auto_workers is set."""
+
+    converter = field.auto.converter
+    kwargs = source_kwargs(source_lang)
+    if not field.auto_workers or len(suffixes) < 2:
+        return {suf: converter.translate_text(value, suf, **kwargs).text for suf in suffixes}
+
+    # Every task runs in copy of caller context, so observers get model and field.
+    futures = [
+        field.get_executor().submit(
+            copy_context().run, converter.translate_text, value, suf, **kwargs
+        )
+        for suf in suffixes
+    ]
+    _, not_done = wait(futures, timeout=field.auto_timeout)
+    if not_done:
+        for future in not_done:
+            future.cancel()
+        raise TranslatorTimeoutError(
+            f'Translation of {field.attrname} to {len(not_done)} languages '
+            f'was not finished in {field.auto_timeout}s.'
+        )
+    # Results are collected in suffixes order, so columns assignment is deterministic.
+    return {suf: future.result().text for suf, future in zip(suffixes, futures)}
 
 
 def translated_attrsetter(name, field):
 
     def _setter(self, value):
 
+        with (
+            observe_context(model=self.__class__.__name__, field=name),
+            observe('setter', characters=len(value) if isinstance(value, str) else 0),
+        ):
+            _set(self, value)
+
+    def _set(self, value):
+
         for v in field.validators:
             v.validate(value)
 
-        if hasattr(field, '_auto'):
-            for suf in field.auto.suffix:
-                convert_value = field.auto.converter.translate_text(value, suf).text
-                setattr(self, to_attribute(name, suf), convert_value)
+        mode = getattr(field, 'auto_mode', IMMEDIATE)
+        if mode == IMMEDIATE and _defer_translation.get(False):
+            mode = DEFERRED
+
+        if (
+            hasattr(field, '_auto')
+            and name not in self.__dict__.get(PENDING_ATTR, ())
+            and field.is_translated(self, value)
+        ):
+            # Source is not changed and already translated.
+            return
+
+        if hasattr(field, '_auto') and mode != IMMEDIATE:
+            # Only source value is set, translation is made once in pre_save,
+            # bulk_create/bulk_update or by translation jobs worker after post_save.
+            source_suffix = get_language() or field.attr_suffix[0]
+            setattr(self, field.column_for(source_suffix), value)
+            # Columns do not match previous source any more, hash is set when
+            # translation is done, not before.
+            field.clear_source_hash(self)
+            self.__dict__.setdefault(PENDING_ATTR, {})[name] = (value, source_suffix, mode)
+        elif hasattr(field, '_auto'):
+            suffixes, source_lang = field.auto.suffix, None
+            if source := field.detect_sources([value]).get(value):
+                # Text is already written in one of field languages: copy it as is.
+                source_lang, source_suffix = source
+                setattr(self, field.column_for(source_suffix), value)
+                suffixes = [suf for suf in suffixes if suf != source_suffix]
+            for suf, convert_value in translate_suffixes(
+                field, value, suffixes, source_lang
+            ).items():
+                setattr(self, field.column_for(suf), convert_value)
+            field.set_source_hash(self, value)
         else:
-            setattr(self, to_attribute(name), value)
+            setattr(self, field.column_for(get_language()), value)
 
     return _setter
 
 
+def _pop_pending(
+    objs: Iterable[Model],
+    mode: str,
+    fields: Iterable[str] | None = None,
+) -> list[tuple[Model, str, str, str]]:
+
+    fields = set(fields) if fields is not None else None
+    pending = []
+    for obj in objs:
+        if not (obj_pending := obj.__dict__.get(PENDING_ATTR)):
+            continue
+        for name, (value, source_suffix, value_mode) in list(obj_pending.items()):
+            if value_mode == mode and (fields is None or name in fields):
+                pending.append((obj, name, value, source_suffix))
+                del obj_pending[name]
+        if not obj_pending:
+            del obj.__dict__[PENDING_ATTR]
+    return pending
+
+
+def _detect_pending(pending: list[tuple[Model, str, str, str]]) -> dict:
+    """Detect languages of all pending values with one batch per field, {(field, text): source}."""
+
+    texts = defaultdict(set)
+    for obj, name, value, _ in pending:
+        texts[getattr(obj.__class__, name)].add(value)
+    return {
+        (field, text): source
+        for field, field_texts in texts.items()
+        for text, source in field.detect_sources(list(field_texts)).items()
+    }
+
+
+def _group_pending(
+    objs: Iterable[Model], fields: Iterable[str] | None = None
+) -> tuple[dict, list[tuple[Model, str, str, str]]]:
+    """
+    Group deferred values as {(converter, suffix, source language): {text: [(obj, column), ...]}}.
+    Values written in one of field languages are copied to that column without translation.
+    Popped pending values are returned too, to set source hashes after translation.
+    """
+
+    pending = _pop_pending(objs, DEFERRED, fields)
+    detected = _detect_pending(pending)
+    groups = defaultdict(lambda: defaultdict(list))
+    for obj, name, value, _ in pending:
+        field = getattr(obj.__class__, name)
+        auto = field.auto
+        source_lang, source_suffix = detected.get((field, value), (None, None))
+        for suf in auto.suffix:
+            if suf == source_suffix:
+                setattr(obj, field.column_for(suf), value)
+                continue
+            groups[(auto.converter, suf, source_lang)][value].append((obj, field.column_for(suf)))
+    return groups, pending
+
+
+def _set_source_hashes(pending: list[tuple[Model, str, str, str]]) -> None:
+
+    for obj, name, value, _ in pending:
+        getattr(obj.__class__, name).set_source_hash(obj, value)
+
+
+def _apply_translations(targets: dict, results: list) -> None:
+
+    for columns, result in zip(targets.values(), results):
+        for obj, column in columns:
+            setattr(obj, column, result.text)
+
+
+def translate_pending(objs: Iterable[Model], fields: Iterable[str] | None = None) -> None:
+    """
+    Translate source values recorded by deferred setters. Unique texts of all
+    objects and fields are sent in one translate_texts call per converter and language.
+    """
+
+    groups, pending = _group_pending(objs, fields)
+    for (converter, suf, source_lang), targets in groups.items():
+        _apply_translations(
+            targets, converter.translate_texts(list(targets), suf, **source_kwargs(source_lang))
+        )
+    _set_source_hashes(pending)
+
+
+async def atranslate_pending(objs: Iterable[Model]) -> None:
+    """Async translate_pending, all converters and languages are translated concurrently."""
+
+    # Language detection is blocking api call.
+    groups, pending = await sync_to_async(_group_pending, thread_sensitive=False)(objs)
+    results = await asyncio.gather(
+        *(
+            converter.atranslate_texts(list(targets), suf, **source_kwargs(source_lang))
+            for (converter, suf, source_lang), targets in groups.items()
+        )
+    )
+    for targets, translated in zip(groups.values(), results):
+        _apply_translations(targets, translated)
+    _set_source_hashes(pending)
+
+
+def _target_suffixes(field, source_suffix: str) -> list[str]:
+
+    source_column = field.column_for(source_suffix)
+    return [suf for suf in field.auto.suffix if field.column_for(suf) != source_column]
+
+
+def enqueue_pending(objs: Iterable[Model], fields: Iterable[str] | None = None) -> None:
+    """Create translation jobs for saved objects with background fields values."""
+
+    objs = [obj for obj in objs if obj.pk is not None]
+    if not (pending := _pop_pending(objs, BACKGROUND, fields)):
+        return
+
+    from extends.jobs.models import TranslationJob
+
+    jobs = []
+    for obj, name, _, source_suffix in pending:
+        field = getattr(obj.__class__, name)
+        jobs.append(
+            TranslationJob.for_object(
+                obj, name, source_suffix, _target_suffixes(field, source_suffix)
+            )
+        )
+    TranslationJob.objects.bulk_create(jobs)
+
+
+def enqueue_rows(model_cls: type[Model], pks: Iterable[Any], sources: dict[str, str]) -> None:
+    """Create translation jobs for rows written by update or create, sources is {name: suffix}."""
+
+    if not (pks := list(pks)) or not sources:
+        return
+
+    from extends.jobs.models import TranslationJob
+
+    TranslationJob.objects.bulk_create(
+        [
+            TranslationJob.for_pk(
+                model_cls,
+                pk,
+                name,
+                source_suffix,
+                _target_suffixes(getattr(model_cls, name), source_suffix),
+            )
+            for pk in pks
+            for name, source_suffix in sources.items()
+        ]
+    )
+
+
+def _translate_pending_on_save(sender, instance, **kwargs) -> None:
+    translate_pending([instance])
+
+
+def _enqueue_pending_on_save(sender, instance, **kwargs) -> None:
+    enqueue_pending([instance])
+
+
+def source_digest(value: Any) -> str:
+    return hashlib.sha256(str(value).encode()).hexdigest()
+
+
+def _needs_translation(desc, manager: Any, digest: str) -> bool:
+    """Check rows of update with one query: source hash is changed or some target is empty."""
+
+    if not desc.source_hash_column or not hasattr(manager, 'get_queryset'):
+        return True
+    stale = ~Q(**{desc.source_hash_column: digest})
+    for suf in desc.auto.suffix:
+        column = desc.column_for(suf)
+        stale |= Q(**{column: ''}) | Q(**{f'{column}__isnull': True})
+    return manager.get_queryset().filter(stale).exists()
+
+
 def _to_orm(desc_kwargs: dict[str, str], orm_call: Callable[..., Any], *args, **kwargs) -> Any:
 
+    manager = getattr(orm_call, '__self__', None)
+    background = {}
     for desc, raw_data in desc_kwargs.items():
         convert_kwargs = raw_data.copy()
-        for raw_field, value in raw_data.items():
-            if hasattr(desc, '_auto'):
-                suf = raw_field.replace(f'{desc.attrname}_', "")
-                convert_kwargs[raw_field] = desc.auto.converter.translate_text(value, suf).text
+        if hasattr(desc, '_auto') and raw_data:
+            value = next(iter(raw_data.values()))
+            digest = source_digest(value)
+            if not _needs_translation(desc, manager, digest):
+                # Every row already has translations of the same source value.
+                continue
+            if getattr(desc, 'auto_mode', IMMEDIATE) == BACKGROUND:
+                # Only active language column is written, rows are translated by worker.
+                source_suffix = get_language() or desc.attr_suffix[0]
+                kwargs[desc.column_for(source_suffix)] = value
+                if desc.source_hash_column:
+                    # Rows are stale until worker saves translations and hash.
+                    kwargs[desc.source_hash_column] = ''
+                background[desc.attrname] = source_suffix
+                continue
+            if desc.source_hash_column:
+                convert_kwargs[desc.source_hash_column] = digest
+            suffixes = {desc.plan.suffixes[raw_field]: raw_field for raw_field in raw_data}
+            with observe_context(model=desc.model.__name__, field=desc.attrname):
+                source_lang = None
+                if source := desc.detect_sources([value]).get(value):
+                    # Source column keeps raw value, it is not translated.
+                    source_lang, source_suffix = source
+                    suffixes.pop(source_suffix, None)
+                translated = translate_suffixes(desc, value, list(suffixes), source_lang)
+            for suf, convert_value in translated.items():
+                convert_kwargs[suffixes[suf]] = convert_value
         kwargs.update(convert_kwargs)
-    return orm_call(*args, **kwargs)
+
+    pks = []
+    if background and hasattr(manager, 'get_queryset'):
+        # Rows are selected before update, it may change their filtered values.
+        pks = list(manager.get_queryset().values_list('pk', flat=True))
+
+    model = next(iter(desc_kwargs)).model if desc_kwargs else None
+    with observe('orm', model=model.__name__ if model else None):
+        result = orm_call(*args, **kwargs)
+    if pks:
+        enqueue_rows(model, pks, background)
+    return result
 
 
 class TranslatedField(ExtendFieldDescriptor, ConverterMixin):
@@ -58,9 +395,19 @@ class TranslatedField(ExtendFieldDescriptor, ConverterMixin):
         attrgetter=translated_attrgetter,
         attrsetter=translated_attrsetter,
         auto=None,
+        auto_mode=IMMEDIATE,
+        auto_workers=None,
+        auto_timeout=None,
         validators=None,
+        fallback=None,
+        source_hash=False,
+        detector=None,
+        detect_threshold=0.5,
     ) -> None:
 
+        if auto_mode not in AUTO_MODES:
+            raise ValueError(f'TranslatedField auto_mode must be one of {AUTO_MODES}.')
+
         attr_suffix = list(attr_suffix or (lang[0] for lang in settings.LANGUAGES))
 
         super().__init__(
@@ -70,19 +417,157 @@ class TranslatedField(ExtendFieldDescriptor, ConverterMixin):
             attrgetter=attrgetter,
             attrsetter=attrsetter,
             validators=validators,
+            fallback=fallback,
         )
+        self.auto_mode = auto_mode
+        # Opt-in concurrent translation of auto suffixes on bounded thread pool.
+        self.auto_workers = auto_workers
+        self.auto_timeout = auto_timeout
+        self._executor = None
+        self._executor_lock = Lock()
+        # Persist source hash in hidden column, otherwise it is kept on instance only.
+        self.source_hash = source_hash
+        self.source_hash_column = None
+        # Optional language detector factory (get_detector for example), it is
+        # created on first detection.
+        self.detector_factory = detector
+        self.detect_threshold = detect_threshold
+        self._detector = None
+
         if auto:
             self._create_auto_property(auto)
 
+    def get_executor(self) -> ThreadPoolExecutor:
+
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.auto_workers,
+                        thread_name_prefix=f'extends-{self.attrname}',
+                    )
+        return self._executor
+
     def _create_auto_property(self, converter_data) -> None:
 
-        conv = converter_data[0]() if converter_data[0] else None
+        conv = LazyConverter(converter_data[0]) if converter_data[0] else None
         suffix = converter_data[1] or self.attr_suffix
         super()._create_auto_property((conv, suffix))
 
     def to_attribute(self, name: str, suffix: str | None = None) -> str:
         return to_attribute(name, language_code=suffix)
 
+    def get_detector(self):
+
+        if self._detector is None and self.detector_factory:
+            with self._executor_lock:
+                if self._detector is None:
+                    self._detector = self.detector_factory()
+        return self._detector
+
+    def suffix_for_language(self, language: str) -> str | None:
+        """Auto suffix for detected language code: exact match or the same primary language."""
+
+        language = language.lower().replace('_', '-')
+        primary = language.split('-')[0]
+        suffixes = {suf.lower().replace('_', '-'): suf for suf in self.auto.suffix}
+        if language in suffixes:
+            return suffixes[language]
+        return next(
+            (suf for code, suf in suffixes.items() if code.split('-')[0] == primary), None
+        )
+
+    def detect_sources(self, texts: list[str]) -> dict[str, tuple[str, str]]:
+        """
+        Detect languages of texts, {text: (language, suffix)} for texts confidently
+        written in one of auto suffixes languages. Empty without detector.
+        """
+
+        if not (detector := self.get_detector()) or not texts:
+            return {}
+        if hasattr(detector, 'batch_detect_languages'):
+            languages = [None] * len(texts)
+            for result in detector.batch_detect_languages(texts):
+                languages[result.index] = result.languages
+        else:
+            languages = [detector.detect_languages(text) for text in texts]
+
+        sources = {}
+        for text, langs in zip(texts, languages):
+            if not langs:
+                continue
+            best = max(langs, key=lambda lang: lang.probability)
+            if best.probability < self.detect_threshold:
+                continue
+            if suffix := self.suffix_for_language(best.language):
+                sources[text] = (best.language, suffix)
+        return sources
+
+    def get_source_hash(self, obj: Model) -> str | None:
+
+        if self.source_hash_column:
+            return getattr(obj, self.source_hash_column, None) or None
+        return obj.__dict__.get(SOURCE_HASHES_ATTR, {}).get(self.attrname)
+
+    def set_source_hash(self, obj: Model, value: Any) -> None:
+
+        digest = source_digest(value)
+        if self.source_hash_column:
+            setattr(obj, self.source_hash_column, digest)
+        else:
+            obj.__dict__.setdefault(SOURCE_HASHES_ATTR, {})[self.attrname] = digest
+
+    def clear_source_hash(self, obj: Model) -> None:
+
+        if self.source_hash_column:
+            setattr(obj, self.source_hash_column, '')
+        else:
+            obj.__dict__.get(SOURCE_HASHES_ATTR, {}).pop(self.attrname, None)
+
+    def is_translated(self, obj: Model, value: Any) -> bool:
+        """
+        Source hash is the only proof that columns hold translations of one
+        source, every write leaving them stale clears it. With hash present and
+        no empty target, value is translated if it is that source or equals
+        active language column (form re-saved with the shown value).
+        """
+
+        if (digest := self.get_source_hash(obj)) is None:
+            return False
+        if not all(getattr(obj, self.column_for(suf), None) for suf in self.auto.suffix):
+            return False
+        language = get_language() or self.attr_suffix[0]
+        return digest == source_digest(value) or getattr(obj, self.column_for(language)) == value
+
+    def effective_expression(self, language: str | None = None) -> Expression:
+        """SQL counterpart of getter: first not empty column of language fallback chain."""
+
+        language = language or get_language() or self.attr_suffix[0]
+        columns = self.plan.fallbacks.get(language) or (self.column_for(language),)
+        if len(columns) == 1:
+            return F(columns[0])
+        return Coalesce(*(NullIf(F(column), Value('')) for column in columns[:-1]), F(columns[-1]))
+
     def contribute_to_class(self, model_cls: Model, name: str) -> None:
         super().contribute_to_class(model_cls, name)
         ExtendModelOptions.install(model_cls, name, self, orm_proxy=_to_orm)
+
+        if self.source_hash:
+            self.source_hash_column = f'{name}_source_hash'
+            CharField(max_length=64, editable=False, blank=True, default='').contribute_to_class(
+                model_cls, self.source_hash_column
+            )
+
+        if hasattr(self, '_auto'):
+            pre_save.connect(
+                _translate_pending_on_save,
+                sender=model_cls,
+                weak=False,
+                dispatch_uid=f'extends_translate_pending_{model_cls._meta.label_lower}',
+            )
+            post_save.connect(
+                _enqueue_pending_on_save,
+                sender=model_cls,
+                weak=False,
+                dispatch_uid=f'extends_enqueue_pending_{model_cls._meta.label_lower}',
+            )
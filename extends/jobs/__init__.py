@@ -0,0 +1 @@
+# DB-backed background translation queue, add "extends.jobs" to INSTALLED_APPS to use it.
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class TranslationJobsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "extends.jobs"
+    label = "extends_jobs"
+    verbose_name = "Translation jobs"
@@ -0,0 +1,53 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from extends.jobs.models import TranslationJob
+from extends.jobs.worker import TranslationWorker
+
+
+class Command(BaseCommand):
+    help = "Translate TranslatedField values queued by auto_mode=BACKGROUND."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--workers", type=int, default=4, help="Concurrent translate calls.")
+        parser.add_argument("--max-attempts", type=int, default=5)
+        parser.add_argument(
+            "--retry-delay", type=float, default=30.0, help="First retry delay in seconds."
+        )
+        parser.add_argument(
+            "--stale-timeout",
+            type=float,
+            default=600.0,
+            help="Return to queue jobs locked by dead worker longer than this seconds.",
+        )
+        parser.add_argument("--loop", action="store_true", help="Keep polling the queue.")
+        parser.add_argument("--sleep", type=float, default=5.0, help="Poll interval for --loop.")
+        parser.add_argument("--stats", action="store_true", help="Print queue depth and exit.")
+
+    def handle(self, *args, **options):
+
+        if options["stats"]:
+            failed = TranslationJob.objects.filter(status=TranslationJob.Status.FAILED).count()
+            self.stdout.write(f"pending: {TranslationJob.objects.depth()}, failed: {failed}")
+            return
+
+        worker = TranslationWorker(
+            batch_size=options["batch_size"],
+            workers=options["workers"],
+            max_attempts=options["max_attempts"],
+            retry_delay=options["retry_delay"],
+        )
+        while True:
+            TranslationJob.objects.release_stale(timedelta(seconds=options["stale_timeout"]))
+            stats = worker.drain()
+            if stats.batches:
+                self.stdout.write(
+                    f"processed: {stats.processed}, failed: {stats.failed}, "
+                    f"pending: {TranslationJob.objects.depth()}"
+                )
+            if not options["loop"]:
+                break
+            time.sleep(options["sleep"])
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:35
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="TranslationJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model", models.CharField(max_length=255)),
+                ("object_pk", models.CharField(max_length=255)),
+                ("field", models.CharField(max_length=255)),
+                ("source_suffix", models.CharField(max_length=16)),
+                ("target_suffixes", models.JSONField(default=list)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processing", "Processing"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True)),
+                (
+                    "locked_by",
+                    models.CharField(blank=True, db_index=True, max_length=32),
+                ),
+                (
+                    "available_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "verbose_name": "translation job",
+                "verbose_name_plural": "translation jobs",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "available_at"],
+                        name="extends_job_status_9f7b92_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,101 @@
+import uuid
+from datetime import timedelta
+
+from django.db import models
+from django.utils import timezone
+
+
+class TranslationJobQuerySet(models.QuerySet):
+
+    def available(self) -> 'TranslationJobQuerySet':
+        return self.filter(
+            status=TranslationJob.Status.PENDING,
+            available_at__lte=timezone.now(),
+        )
+
+    def depth(self) -> int:
+        """Count of jobs waiting for worker."""
+        return self.filter(status=TranslationJob.Status.PENDING).count()
+
+    def claim(self, batch_size: int) -> list['TranslationJob']:
+        """
+        Mark batch of available jobs as processing by unique token. Conditional
+        update guarantees that concurrent workers never get the same job.
+        """
+
+        token = uuid.uuid4().hex
+        ids = list(self.available().order_by('id').values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return []
+        self.filter(id__in=ids, status=TranslationJob.Status.PENDING).update(
+            status=TranslationJob.Status.PROCESSING,
+            locked_by=token,
+            updated_at=timezone.now(),
+        )
+        return list(self.filter(locked_by=token).order_by('id'))
+
+    def release_stale(self, timeout: timedelta) -> int:
+        """Return to queue jobs of workers which died while processing."""
+
+        return self.filter(
+            status=TranslationJob.Status.PROCESSING,
+            updated_at__lt=timezone.now() - timeout,
+        ).update(status=TranslationJob.Status.PENDING, locked_by='')
+
+
+class TranslationJob(models.Model):
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        PROCESSING = 'processing', 'Processing'
+        FAILED = 'failed', 'Failed'
+
+    model = models.CharField(max_length=255)
+    object_pk = models.CharField(max_length=255)
+    field = models.CharField(max_length=255)
+    source_suffix = models.CharField(max_length=16)
+    target_suffixes = models.JSONField(default=list)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    locked_by = models.CharField(max_length=32, blank=True, db_index=True)
+    available_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    objects = TranslationJobQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "translation job"
+        verbose_name_plural = "translation jobs"
+        indexes = [models.Index(fields=['status', 'available_at'])]
+
+    def __str__(self):
+        return f'{self.model}:{self.object_pk}.{self.field} [{self.status}]'
+
+    @classmethod
+    def for_object(
+        cls,
+        obj: models.Model,
+        field: str,
+        source_suffix: str,
+        target_suffixes: list[str],
+    ) -> 'TranslationJob':
+        return cls.for_pk(obj.__class__, obj.pk, field, source_suffix, target_suffixes)
+
+    @classmethod
+    def for_pk(
+        cls,
+        model_cls: type[models.Model],
+        pk: object,
+        field: str,
+        source_suffix: str,
+        target_suffixes: list[str],
+    ) -> 'TranslationJob':
+        return cls(
+            model=model_cls._meta.label_lower,
+            object_pk=str(pk),
+            field=field,
+            source_suffix=source_suffix,
+            target_suffixes=list(target_suffixes),
+        )
@@ -0,0 +1,158 @@
+import logging
+from datetime import timedelta
+from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.utils import timezone
+
+from .models import TranslationJob
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DrainStats:
+
+    processed: int = 0
+    failed: int = 0
+    batches: int = 0
+
+
+class TranslationWorker:
+    """
+    Drain TranslationJob queue. Jobs of one batch are grouped by converter and
+    target language, so every group is one translate_texts call. Groups are
+    translated concurrently, failed jobs are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        workers: int = 4,
+        max_attempts: int = 5,
+        retry_delay: float = 30.0,
+    ) -> None:
+
+        self.batch_size = batch_size
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def drain(self, max_batches: int | None = None) -> DrainStats:
+
+        stats = DrainStats()
+        while max_batches is None or stats.batches < max_batches:
+            if not (jobs := TranslationJob.objects.claim(self.batch_size)):
+                break
+            failed = self.process(jobs)
+            stats.batches += 1
+            stats.processed += len(jobs) - len(failed)
+            stats.failed += len(failed)
+        return stats
+
+    def process(self, jobs: list[TranslationJob]) -> set[TranslationJob]:
+        """Translate claimed jobs and return failed ones."""
+
+        groups = defaultdict(lambda: defaultdict(list))
+        objects, sources, failed, changed = {}, {}, {}, defaultdict(set)
+
+        for job in jobs:
+            try:
+                prepared = self._prepare(job, jobs, objects)
+            except Exception as e:
+                # Model or field was removed, or converter can not be built:
+                # only this job fails, the rest of the batch is translated.
+                logger.warning('Translation job %s failed: %s', job, e)
+                failed[job] = e
+                continue
+            if not prepared:
+                continue
+            obj, field, value, converter = prepared
+            sources[job] = (obj, field, value)
+            for suf in job.target_suffixes:
+                groups[(converter, suf)][value].append((job, obj, field.column_for(suf)))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                (converter, suf): pool.submit(converter.translate_texts, list(targets), suf)
+                for (converter, suf), targets in groups.items()
+            }
+            for key, future in futures.items():
+                targets = groups[key]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.warning('Translation jobs group %s failed: %s', key[1], e)
+                    for columns in targets.values():
+                        failed.update({job: e for job, _, _ in columns})
+                    continue
+                for columns, result in zip(targets.values(), results):
+                    for _, obj, column in columns:
+                        setattr(obj, column, result.text)
+                        changed[obj].add(column)
+
+        # Source hash is saved only with all translations of the job.
+        for job, (obj, field, value) in sources.items():
+            if job in failed:
+                continue
+            field.set_source_hash(obj, value)
+            if field.source_hash_column:
+                changed[obj].add(field.source_hash_column)
+
+        self._save(changed)
+        self._finish(jobs, failed)
+        return set(failed)
+
+    @staticmethod
+    def _prepare(job: TranslationJob, jobs: list[TranslationJob], objects: dict) -> tuple | None:
+        """Object, field, source value and converter of job, None if nothing to translate."""
+
+        model_cls = apps.get_model(job.model)
+        if job.model not in objects:
+            pks = [j.object_pk for j in jobs if j.model == job.model]
+            objects[job.model] = {
+                str(pk): obj for pk, obj in model_cls._base_manager.in_bulk(pks).items()
+            }
+        if not (obj := objects[job.model].get(job.object_pk)):
+            # Object was deleted after save, nothing to translate.
+            return None
+        field = getattr(model_cls, job.field)
+        if not (value := getattr(obj, field.column_for(job.source_suffix))):
+            return None
+        return obj, field, value, field.auto.converter
+
+    @staticmethod
+    def _save(changed: dict) -> None:
+
+        batches = defaultdict(list)
+        for obj, columns in changed.items():
+            batches[(obj.__class__, frozenset(columns))].append(obj)
+        for (model_cls, columns), objs in batches.items():
+            model_cls._base_manager.bulk_update(objs, sorted(columns))
+
+    def _finish(self, jobs: list[TranslationJob], failed: dict) -> None:
+
+        TranslationJob.objects.filter(
+            id__in=[job.id for job in jobs if job not in failed]
+        ).delete()
+
+        now = timezone.now()
+        for job, error in failed.items():
+            job.attempts += 1
+            job.last_error = str(error)
+            job.locked_by = ''
+            job.updated_at = now
+            if job.attempts >= self.max_attempts:
+                job.status = TranslationJob.Status.FAILED
+            else:
+                job.status = TranslationJob.Status.PENDING
+                job.available_at = now + timedelta(
+                    seconds=self.retry_delay * 2 ** (job.attempts - 1)
+                )
+        TranslationJob.objects.bulk_update(
+            list(failed),
+            ['attempts', 'last_error', 'locked_by', 'updated_at', 'status', 'available_at'],
+        )
@@ -1,12 +1,141 @@
+import asyncio
 import inspect
-from typing import Any
+from typing import Any, Iterable, Mapping
 from functools import wraps
 from collections import defaultdict
 
+from asgiref.sync import sync_to_async
+from django.utils.translation import get_language
+from django.db.models import Model, Q, F
+from django.db.models.query import QuerySet
 from django.db.models.manager import Manager
 
 
-class TranslatedManagerWorkPiece:
+class WorkPiece:
+
+    @classmethod
+    def get_override_workpiece_methods(cls) -> dict:
+
+        def create_method(name, method):
+
+            if inspect.iscoroutinefunction(method):
+
+                @wraps(method)
+                async def override_method(self, *args, **kwargs):
+                    return await getattr(cls, name)(self, *args, **kwargs)
+
+            else:
+
+                @wraps(method)
+                def override_method(self, *args, **kwargs):
+                    return getattr(cls, name)(self, *args, **kwargs)
+
+            return override_method
+
+        override_methods = {}
+        for name, method in inspect.getmembers(
+            cls,
+            predicate=inspect.isfunction,
+        ):
+            override_methods[name] = create_method(name, method)
+        return override_methods
+
+
+class TranslatedQuerySetWorkPiece(WorkPiece):
+    """Rewrite TranslatedField names to active language columns in queryset methods."""
+
+    def filter(self: QuerySet, *args, **kwargs) -> QuerySet:
+        args, kwargs = self._translate_lookups(args, kwargs)
+        return super(self.__class__, self).filter(*args, **kwargs)
+
+    def exclude(self: QuerySet, *args, **kwargs) -> QuerySet:
+        args, kwargs = self._translate_lookups(args, kwargs)
+        return super(self.__class__, self).exclude(*args, **kwargs)
+
+    def get(self: QuerySet, *args, **kwargs) -> Model:
+        args, kwargs = self._translate_lookups(args, kwargs)
+        return super(self.__class__, self).get(*args, **kwargs)
+
+    def order_by(self: QuerySet, *field_names) -> QuerySet:
+        return super(self.__class__, self).order_by(*map(self._translate_name, field_names))
+
+    def values(self: QuerySet, *fields, **expressions) -> QuerySet:
+
+        # Translated names keep their keys in result dicts: {'question': ...}.
+        names = []
+        for name in fields:
+            if (column := self._translate_name(name)) != name:
+                expressions[name] = F(column)
+            else:
+                names.append(name)
+        return super(self.__class__, self).values(*names, **expressions)
+
+    def values_list(self: QuerySet, *fields, **kwargs) -> QuerySet:
+        return super(self.__class__, self).values_list(
+            *map(self._translate_name, fields), **kwargs
+        )
+
+    def only(self: QuerySet, *fields) -> QuerySet:
+        return super(self.__class__, self).only(*map(self._translate_name, fields))
+
+    def defer(self: QuerySet, *fields) -> QuerySet:
+
+        # Deferred translated name means any of its languages is not needed.
+        descriptors = getattr(self.model._meta, 'extend_descriptor', {})
+        columns = []
+        for name in fields:
+            columns.extend(descriptors[name].fields if name in descriptors else [name])
+        return super(self.__class__, self).defer(*columns)
+
+    def current_language_only(self: QuerySet) -> QuerySet:
+        """Defer every TranslatedField column except the ones getter reads now."""
+
+        columns = []
+        for desc in getattr(self.model._meta, 'extend_descriptor', {}).values():
+            language = get_language() or desc.attr_suffix[0]
+            # Getter falls back to these columns when active language one is empty.
+            loaded = desc.plan.fallbacks.get(language) or (desc.column_for(language),)
+            columns.extend(column for column in desc.fields if column not in loaded)
+        return super(self.__class__, self).defer(*columns)
+
+    def _translate_name(self: QuerySet, name: Any) -> Any:
+
+        if not isinstance(name, str):
+            return name
+        prefix = '-' if name.startswith('-') else ''
+        field_name, sep, lookup = name.removeprefix(prefix).partition('__')
+        if not (desc := getattr(self.model._meta, 'extend_descriptor', {}).get(field_name)):
+            return name
+        language = get_language() or desc.attr_suffix[0]
+        return f'{prefix}{desc.column_for(language)}{sep}{lookup}'
+
+    def _translate_q(self: QuerySet, q: Q) -> Q:
+
+        clone = q.copy()
+        clone.children = [
+            self._translate_q(child) if isinstance(child, Q)
+            else (self._translate_name(child[0]), child[1])
+            for child in q.children
+        ]
+        return clone
+
+    def _translate_lookups(self: QuerySet, args: tuple, kwargs: dict) -> tuple[tuple, dict]:
+
+        args = tuple(self._translate_q(arg) if isinstance(arg, Q) else arg for arg in args)
+        kwargs = {self._translate_name(key): value for key, value in kwargs.items()}
+        return args, kwargs
+
+
+class TranslatedManagerWorkPiece(WorkPiece):
+
+    def get_queryset(self: Manager) -> QuerySet:
+        queryset = super(self.__class__, self).get_queryset()
+        if getattr(self, 'current_language_default', False):
+            return queryset.current_language_only()
+        return queryset
+
+    def current_language_only(self: Manager) -> QuerySet:
+        return self.get_queryset().current_language_only()
 
     def update(self: Manager, **kwargs) -> int:
         desc_kwargs, kwargs = self._prepare_data(**kwargs)
@@ -17,6 +146,176 @@ class TranslatedManagerWorkPiece:
 
         return self.orm_proxy(desc_kwargs, final_call, **kwargs)
 
+    async def aupdate(self: Manager, **kwargs) -> int:
+
+        from extends.fields.translated_field import enqueue_rows
+
+        desc_kwargs, kwargs = self._prepare_data(**kwargs)
+        converted, background = await self._atranslate_data(desc_kwargs, skip_unchanged=True)
+        kwargs.update(converted)
+
+        pks = []
+        if background:
+            pks = [pk async for pk in self.get_queryset().values_list('pk', flat=True)]
+
+        final_call = super(self.__class__, self).update
+        rows = await sync_to_async(final_call)(**kwargs)
+        await sync_to_async(enqueue_rows)(self.model, pks, background)
+        return rows
+
+    async def acreate(self: Manager, **kwargs) -> Model:
+
+        from extends.fields.translated_field import enqueue_rows
+
+        desc_kwargs, kwargs = self._prepare_data(**kwargs)
+        converted, background = await self._atranslate_data(desc_kwargs)
+        kwargs.update(converted)
+
+        obj = await super(self.__class__, self).acreate(**kwargs)
+        await sync_to_async(enqueue_rows)(self.model, [obj.pk], background)
+        return obj
+
+    def bulk_create(
+        self: Manager,
+        objs: Iterable[Model | Mapping[str, Any]],
+        *args,
+        **kwargs,
+    ) -> list[Model]:
+        """
+        Objects may be model instances or mappings of model kwargs with translated
+        names. Auto translated values are deduplicated across all objects and
+        translated in one batch per language before single INSERT batch.
+        """
+
+        from extends.fields.translated_field import translate_pending, enqueue_pending
+
+        objs = self._build_objs(objs)
+        translate_pending(objs)
+
+        final_call = super(self.__class__, self).bulk_create
+        created = final_call(objs, *args, **kwargs)
+        enqueue_pending(created)
+        return created
+
+    async def abulk_create(
+        self: Manager,
+        objs: Iterable[Model | Mapping[str, Any]],
+        *args,
+        **kwargs,
+    ) -> list[Model]:
+
+        from extends.fields.translated_field import atranslate_pending, enqueue_pending
+
+        objs = self._build_objs(objs)
+        await atranslate_pending(objs)
+
+        created = await super(self.__class__, self).abulk_create(objs, *args, **kwargs)
+        await sync_to_async(enqueue_pending)(created)
+        return created
+
+    def bulk_update(
+        self: Manager,
+        objs: Iterable[Model],
+        fields: Iterable[str],
+        *args,
+        **kwargs,
+    ) -> int:
+        """
+        Translated names in fields are expanded to suffix columns. Only objects
+        with changed deferred values are translated, in one batch per language:
+        assign values inside defer_translation() or use DEFERRED fields, setters
+        of IMMEDIATE fields translate every object on assignment.
+        """
+
+        from extends.fields.translated_field import translate_pending, enqueue_pending
+
+        objs, fields = list(objs), list(fields)
+        descriptors = self.model._meta.extend_descriptor
+        translated = [name for name in fields if name in descriptors]
+        translate_pending(objs, translated)
+
+        columns = []
+        for name in fields:
+            if name not in descriptors:
+                columns.append(name)
+                continue
+            columns.extend(descriptors[name].fields)
+            if hash_column := getattr(descriptors[name], 'source_hash_column', None):
+                # Hash of translated source must be saved with the columns.
+                columns.append(hash_column)
+
+        final_call = super(self.__class__, self).bulk_update
+        rows = final_call(objs, list(dict.fromkeys(columns)), *args, **kwargs)
+        enqueue_pending(objs, translated)
+        return rows
+
+    def _build_objs(self: Manager, objs: Iterable[Model | Mapping[str, Any]]) -> list[Model]:
+
+        from extends.fields.translated_field import defer_translation
+
+        # Setters only record source values, translation is made for all objects at once.
+        with defer_translation():
+            return [self.model(**obj) if isinstance(obj, Mapping) else obj for obj in objs]
+
+    async def _atranslate_data(
+        self: Manager, desc_kwargs: dict, skip_unchanged: bool = False
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """
+        Async counterpart of orm_proxy: translate every auto suffix concurrently.
+        With skip_unchanged, fields whose rows all have translations of the same
+        source are left out of update. Background fields are returned as
+        {name: source suffix} with only active language column written.
+        """
+
+        from extends.fields.translated_field import (
+            BACKGROUND,
+            IMMEDIATE,
+            source_digest,
+            _needs_translation,
+        )
+
+        columns, tasks, extra, skipped, background = [], [], {}, set(), {}
+        for desc, raw_data in desc_kwargs.items():
+            if not hasattr(desc, '_auto'):
+                continue
+            value = next(iter(raw_data.values()))
+            digest = source_digest(value)
+            if skip_unchanged and not await sync_to_async(_needs_translation)(desc, self, digest):
+                skipped.add(desc)
+                continue
+            if getattr(desc, 'auto_mode', IMMEDIATE) == BACKGROUND:
+                source_suffix = get_language() or desc.attr_suffix[0]
+                # Only active language column is written, rows are translated by worker.
+                extra[desc.column_for(source_suffix)] = value
+                if getattr(desc, 'source_hash_column', None):
+                    # Rows are stale until worker saves translations and hash.
+                    extra[desc.source_hash_column] = ''
+                background[desc.attrname] = source_suffix
+                skipped.add(desc)
+                continue
+            if getattr(desc, 'source_hash_column', None):
+                extra[desc.source_hash_column] = digest
+            detected = await sync_to_async(desc.detect_sources, thread_sensitive=False)([value])
+            source_lang, source_suffix = detected.get(value, (None, None))
+            for suf in desc.auto.suffix:
+                if suf == source_suffix:
+                    # Raw value is kept in column of detected language.
+                    continue
+                column = desc.column_for(suf)
+                columns.append(column)
+                tasks.append(desc.auto.converter.atranslate_text(value, suf, source_lang))
+
+        results = await asyncio.gather(*tasks)
+        converted = {
+            column: value
+            for desc, raw_data in desc_kwargs.items()
+            if desc not in skipped
+            for column, value in raw_data.items()
+        }
+        converted.update({column: result.text for column, result in zip(columns, results)})
+        converted.update(extra)
+        return converted, background
+
     def _prepare_data(self: Manager, *args, **kwargs) -> dict[str, str] | dict[str, Any]:
 
         model_cls = self.model
@@ -32,34 +331,30 @@ class TranslatedManagerWorkPiece:
 
                 if hasattr(desc, '_auto'):
                     for suf in desc.auto.suffix:
-                        desc_kwargs[desc].update({desc.to_attribute(name, suffix=suf): value})
+                        desc_kwargs[desc].update({desc.column_for(suf): value})
                 else:
-                    desc_kwargs[desc].update({desc.to_attribute(name): value})
+                    desc_kwargs[desc].update({desc.column_for(get_language()): value})
+            elif (hash_column := getattr(desc, 'source_hash_column', None)) and any(
+                column in kwargs for column in desc.fields
+            ):
+                # Language columns are written as is, they are not translations of hashed source.
+                kwargs.setdefault(hash_column, '')
         return desc_kwargs, kwargs
 
-    @classmethod
-    def get_override_workpiece_methods(cls) -> dict:
-
-        def create_method(name, method):
-
-            @wraps(method)
-            def override_method(self, *args, **kwargs):
-                return getattr(cls, name)(self, *args, **kwargs)
-
-            return override_method
-
-        override_methods = {}
-        for name, method in inspect.getmembers(
-            cls,
-            predicate=inspect.isfunction,
-        ):
-            override_methods[name] = create_method(name, method)
-        return override_methods
-
 
 class ManagerBuilder:
 
     workpiece_manager = TranslatedManagerWorkPiece
+    workpiece_queryset = TranslatedQuerySetWorkPiece
+
+    def create_queryset(self, src_manager: Manager) -> type[QuerySet]:
+        return type(
+            'TranslatedQuerySet',
+            (src_manager._queryset_class,),
+            {
+                **self.workpiece_queryset.get_override_workpiece_methods(),
+            },
+        )
 
     def create_manager(self, src_manager: Manager) -> Manager:
         return type(
@@ -67,5 +362,7 @@ class ManagerBuilder:
             (src_manager.__class__,),
             {
                 **self.workpiece_manager.get_override_workpiece_methods(),
+                # BaseManager.get_queryset builds querysets of this class.
+                '_queryset_class': self.create_queryset(src_manager),
             },
         )
@@ -0,0 +1 @@
+# Persistent translation memory, add "extends.memory" to INSTALLED_APPS to use it.
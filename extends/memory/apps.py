@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class TranslationMemoryConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "extends.memory"
+    label = "extends_memory"
+    verbose_name = "Translation memory"
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="TranslationMemory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("digest", models.CharField(max_length=64, unique=True)),
+                ("source_text", models.TextField()),
+                ("source_lang", models.CharField(blank=True, max_length=16)),
+                ("target_lang", models.CharField(max_length=16)),
+                ("text", models.TextField()),
+                ("detected_source_lang", models.CharField(blank=True, max_length=16)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "translation memory",
+                "verbose_name_plural": "translation memory",
+            },
+        ),
+    ]
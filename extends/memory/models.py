@@ -0,0 +1,71 @@
+import hashlib
+from typing import Iterable
+
+from django.db import models
+
+
+def make_digest(src_text: str, target_lang: str, source_lang: str | None = None) -> str:
+    raw = '\x1f'.join((source_lang or '', target_lang, src_text))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class TranslationMemoryQuerySet(models.QuerySet):
+
+    def lookup(
+        self,
+        texts: Iterable[str],
+        target_lang: str,
+        source_lang: str | None = None,
+    ) -> dict[str, 'TranslationMemory']:
+        """Return stored translations for many texts with single query."""
+
+        digests = {make_digest(text, target_lang, source_lang): text for text in texts}
+        if not digests:
+            return {}
+        return {
+            digests[entry.digest]: entry
+            for entry in self.filter(digest__in=list(digests))
+        }
+
+    def store(
+        self,
+        translations: dict[str, tuple[str, str]],
+        target_lang: str,
+        source_lang: str | None = None,
+    ) -> None:
+        """Save {source text: (translated text, detected source lang)} with single query."""
+
+        self.bulk_create(
+            [
+                self.model(
+                    digest=make_digest(src_text, target_lang, source_lang),
+                    source_text=src_text,
+                    source_lang=source_lang or '',
+                    target_lang=target_lang,
+                    text=text,
+                    detected_source_lang=detected_source_lang or '',
+                )
+                for src_text, (text, detected_source_lang) in translations.items()
+            ],
+            ignore_conflicts=True,
+        )
+
+
+class TranslationMemory(models.Model):
+
+    digest = models.CharField(max_length=64, unique=True)
+    source_text = models.TextField()
+    source_lang = models.CharField(max_length=16, blank=True)
+    target_lang = models.CharField(max_length=16)
+    text = models.TextField()
+    detected_source_lang = models.CharField(max_length=16, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = TranslationMemoryQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "translation memory"
+        verbose_name_plural = "translation memory"
+
+    def __str__(self):
+        return f'{self.source_text[:50]} [{self.target_lang}]'
@@ -0,0 +1,87 @@
+from typing import Callable
+
+from extends.opportunity import TranslatorBase, TranslatorWrapper, TextResultModel
+from extends.opportunity.bases import source_kwargs
+
+
+class MemoryTranslator(TranslatorWrapper):
+    """
+    Consult TranslationMemory table before remote api call and write back after.
+    Shared by every process which use the same database.
+    """
+
+    def __init__(self, translator: TranslatorBase, using: str | None = None) -> None:
+
+        super().__init__(translator)
+        self.using = using
+
+    @property
+    def queryset(self):
+
+        from .models import TranslationMemory
+
+        return TranslationMemory.objects.using(self.using)
+
+    def translate_text(
+        self, src_text: str, target_lang: str, source_lang: str | None = None
+    ) -> TextResultModel:
+
+        if entry := self.queryset.lookup([src_text], target_lang, source_lang).get(src_text):
+            return TextResultModel(
+                text=entry.text,
+                detected_source_lang=entry.detected_source_lang,
+            )
+
+        result = self.translator.translate_text(src_text, target_lang, **source_kwargs(source_lang))
+        self.queryset.store(
+            {src_text: (result.text, result.detected_source_lang)},
+            target_lang,
+            source_lang,
+        )
+        return result
+
+    def translate_texts(
+        self, texts: list[str], target_lang: str, source_lang: str | None = None
+    ) -> list[TextResultModel]:
+
+        results = {
+            src_text: TextResultModel(
+                text=entry.text,
+                detected_source_lang=entry.detected_source_lang,
+            )
+            for src_text, entry in self.queryset.lookup(
+                set(texts), target_lang, source_lang
+            ).items()
+        }
+        if misses := list(dict.fromkeys(text for text in texts if text not in results)):
+            translated = dict(
+                zip(
+                    misses,
+                    self.translator.translate_texts(
+                        misses, target_lang, **source_kwargs(source_lang)
+                    ),
+                )
+            )
+            self.queryset.store(
+                {
+                    src_text: (result.text, result.detected_source_lang)
+                    for src_text, result in translated.items()
+                },
+                target_lang,
+                source_lang,
+            )
+            results.update(translated)
+        return [results[text] for text in texts]
+
+
+def memorized(
+    factory: Callable[[], TranslatorBase],
+    using: str | None = None,
+) -> Callable[[], MemoryTranslator]:
+    """Wrap translator factory for ExtendMeta.converter or TranslatedField auto param."""
+
+    def memorized_factory() -> MemoryTranslator:
+        return MemoryTranslator(factory(), using=using)
+
+    memorized_factory.__name__ = f'memorized_{getattr(factory, "__name__", "translator")}'
+    return memorized_factory
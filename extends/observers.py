@@ -0,0 +1,183 @@
+import time
+from threading import Lock
+from contextvars import ContextVar
+from collections import defaultdict
+from typing import Any, Callable, NamedTuple
+
+
+class Event(NamedTuple):
+
+    kind: str  # translate, detect, orm, setter, cache
+    model: str | None
+    field: str | None
+    target_lang: str | None
+    characters: int
+    latency: float
+    outcome: str  # ok or exception class name
+    cache: str | None  # hit, miss or None
+
+
+Observer = Callable[[Event], None]
+
+_observers: list[Observer] = []
+_context = ContextVar("observe_context", default={})
+
+
+def register_observer(observer: Observer) -> Observer:
+    if observer not in _observers:
+        _observers.append(observer)
+    return observer
+
+
+def unregister_observer(observer: Observer) -> None:
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def notify(event: Event) -> None:
+    for observer in list(_observers):
+        observer(event)
+
+
+def observing() -> bool:
+    return bool(_observers)
+
+
+def record(kind: str, **data) -> None:
+    """Notify observers about instant event without latency (cache hit for example)."""
+    if _observers:
+        with _Observation(kind, data):
+            pass
+
+
+class _Observation:
+
+    __slots__ = ('kind', 'data', 'start')
+
+    def __init__(self, kind: str, data: dict[str, Any]) -> None:
+        self.kind = kind
+        self.data = data
+
+    def set(self, **data) -> None:
+        self.data.update(data)
+
+    def __enter__(self) -> '_Observation':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        latency = time.perf_counter() - self.start
+        data = {**_context.get(), **self.data}
+        notify(
+            Event(
+                kind=self.kind,
+                model=data.get('model'),
+                field=data.get('field'),
+                target_lang=data.get('target_lang'),
+                characters=data.get('characters', 0),
+                latency=latency,
+                outcome=exc_type.__name__ if exc_type else 'ok',
+                cache=data.get('cache'),
+            )
+        )
+
+
+class _NoopObservation:
+
+    __slots__ = ()
+
+    def set(self, **data) -> None:
+        pass
+
+    def __enter__(self) -> '_NoopObservation':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_noop = _NoopObservation()
+
+
+class _ObservationContext:
+
+    __slots__ = ('data', 'token')
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+
+    def __enter__(self) -> '_ObservationContext':
+        self.token = _context.set({**_context.get(), **self.data})
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _context.reset(self.token)
+
+
+def observe_context(**data) -> _ObservationContext | _NoopObservation:
+    """Set model and field for events inside block, translators don't know them."""
+    if not _observers:
+        return _noop
+    return _ObservationContext(data)
+
+
+def observe(kind: str, **data) -> _Observation | _NoopObservation:
+    """Measure block and notify observers, costs nothing when observers are not registered."""
+    if not _observers:
+        return _noop
+    return _Observation(kind, data)
+
+
+class StatsObserver:
+    """In-memory aggregator of events per model, field and kind."""
+
+    COLUMNS = (
+        'model', 'field', 'kind', 'calls', 'errors', 'chars', 'seconds', 'hits', 'misses'
+    )
+
+    def __init__(self) -> None:
+
+        self._lock = Lock()
+        self._stats = defaultdict(lambda: defaultdict(float))
+
+    def __call__(self, event: Event) -> None:
+
+        with self._lock:
+            stats = self._stats[(event.model or '-', event.field or '-', event.kind)]
+            stats['calls'] += 1
+            stats['errors'] += event.outcome != 'ok'
+            stats['chars'] += event.characters
+            stats['seconds'] += event.latency
+            stats['hits'] += event.cache == 'hit'
+            stats['misses'] += event.cache == 'miss'
+
+    def rows(self) -> list[dict[str, Any]]:
+
+        with self._lock:
+            return [
+                {
+                    'model': model,
+                    'field': field,
+                    'kind': kind,
+                    **{k: int(stats[k]) for k in ('calls', 'errors', 'chars', 'hits', 'misses')},
+                    'seconds': round(stats['seconds'], 4),
+                }
+                for (model, field, kind), stats in sorted(self._stats.items())
+            ]
+
+    def table(self) -> str:
+
+        rows = [[str(row[column]) for column in self.COLUMNS] for row in self.rows()]
+        widths = [
+            max(len(column), *(len(row[i]) for row in rows)) if rows else len(column)
+            for i, column in enumerate(self.COLUMNS)
+        ]
+        lines = [
+            '  '.join(value.ljust(width) for value, width in zip(row, widths))
+            for row in [list(self.COLUMNS), *rows]
+        ]
+        return '\n'.join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
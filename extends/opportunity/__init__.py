@@ -1,10 +1,53 @@
-from .bases import TranslatorBase, ApiHandler  # noqa
-from .translators import TextResultModel, DeeplTranslator, get_translator  # noqa
-from .language_detector import (  # noqa
-    LangsModel,
-    BatchLangsModel,
-    AWSLanguageDetector,
-    get_detector,
-    AWSLangsModel,
-    AWSBatchLangsModel,
-)
+from importlib import import_module
+
+# Translators and detectors pull deepl, botocore and pydantic, so every name is
+# imported from its module on first access (PEP 562), not at package import.
+_LAZY_ATTRS = {
+    '.bases': ('TranslatorBase', 'TranslatorWrapper', 'LanguageDetectorBase', 'ApiHandler'),
+    '.clients': ('ClientRegistry', 'get_deepl_client', 'get_boto3_client'),
+    '.throttling': ('TokenBucket', 'RateLimiter', 'Backoff', 'QuotaGuard'),
+    '.cache': (
+        'MemoryCache',
+        'CachedTranslator',
+        'CacheInfo',
+        'cached',
+        'DjangoCache',
+        'CachedDetector',
+        'cached_detector',
+    ),
+    '.translators': ('TextResultModel', 'TrustedTextResult', 'DeeplTranslator', 'get_translator'),
+    '.language_detector': (
+        'LangsModel',
+        'BatchLangsModel',
+        'AWSLanguageDetector',
+        'get_detector',
+        'AWSLangsModel',
+        'AWSBatchLangsModel',
+        'TrustedLangs',
+        'TrustedBatchLangs',
+    ),
+    '.stand_in': (
+        'Simulation',
+        'Recording',
+        'StandInTranslator',
+        'StandInDetector',
+        'RecordingTranslator',
+        'RecordingDetector',
+    ),
+}
+_MODULES = {name: module for module, names in _LAZY_ATTRS.items() for name in names}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+
+    if name not in _MODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
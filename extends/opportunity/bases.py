@@ -1,15 +1,79 @@
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 from abc import ABC, abstractmethod
 
-from pydantic import BaseModel
+from asgiref.sync import sync_to_async
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+def source_kwargs(source_lang: str | None) -> dict[str, str]:
+    """
+    Source language is passed only when it is known (detected), so translators
+    without source_lang param keep working until detector is used.
+    """
+    return {'source_lang': source_lang} if source_lang else {}
 
 
 class TranslatorBase(ABC):
 
     @abstractmethod
-    def translate_text(self, src_text: str, target_lang: str) -> BaseModel:
+    def translate_text(
+        self, src_text: str, target_lang: str, source_lang: str | None = None
+    ) -> BaseModel:
         pass
 
+    def translate_texts(
+        self, texts: list[str], target_lang: str, source_lang: str | None = None
+    ) -> list[BaseModel]:
+        """Translate many texts, override it if api supports batch requests."""
+        kwargs = source_kwargs(source_lang)
+        return [self.translate_text(text, target_lang, **kwargs) for text in texts]
+
+    # Blocking api calls run in executor threads. thread_sensitive=False lets
+    # several translations of one event loop go concurrently.
+    async def atranslate_text(
+        self, src_text: str, target_lang: str, source_lang: str | None = None
+    ) -> BaseModel:
+        return await sync_to_async(self.translate_text, thread_sensitive=False)(
+            src_text, target_lang, **source_kwargs(source_lang)
+        )
+
+    async def atranslate_texts(
+        self, texts: list[str], target_lang: str, source_lang: str | None = None
+    ) -> list[BaseModel]:
+        return await sync_to_async(self.translate_texts, thread_sensitive=False)(
+            texts, target_lang, **source_kwargs(source_lang)
+        )
+
+
+class TranslatorWrapper(TranslatorBase):
+    """Base for translators which decorate another TranslatorBase."""
+
+    def __init__(self, translator: TranslatorBase) -> None:
+
+        self.translator = translator
+
+    def __getattr__(self, name: str) -> Any:
+        # Proxy api specific attributes (LANGUAGE_MAPPER, make_request ...) to wrapped object.
+        try:
+            translator = self.__dict__['translator']
+        except KeyError:
+            raise AttributeError(name)
+        return getattr(translator, name)
+
+    def translate_text(
+        self, src_text: str, target_lang: str, source_lang: str | None = None
+    ) -> BaseModel:
+        return self.translator.translate_text(src_text, target_lang, **source_kwargs(source_lang))
+
+    def translate_texts(
+        self, texts: list[str], target_lang: str, source_lang: str | None = None
+    ) -> list[BaseModel]:
+        return self.translator.translate_texts(texts, target_lang, **source_kwargs(source_lang))
+
 
 class LanguageDetectorBase(ABC):
 
@@ -17,6 +81,9 @@ class LanguageDetectorBase(ABC):
     def detect_languages(self, text: str) -> BaseModel:
         pass
 
+    async def adetect_languages(self, text: str) -> BaseModel:
+        return await sync_to_async(self.detect_languages, thread_sensitive=False)(text)
+
 
 class ApiHandler(ABC):
 
@@ -0,0 +1,338 @@
+import re
+import time
+import hashlib
+import unicodedata
+from threading import RLock
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable, Iterable
+
+from pydantic import BaseModel
+
+from extends.observers import observe, observing, record
+from .bases import TranslatorBase, TranslatorWrapper, LanguageDetectorBase, source_kwargs
+from .language_detector import (
+    LangsModel,
+    BatchLangsModel,
+    AWSLangsModel,
+    AWSBatchLangsModel,
+    TrustedLangs,
+    TrustedBatchLangs,
+)
+
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize ttl')
+
+_MISSING = object()
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache with optional TTL eviction."""
+
+    def __init__(
+        self,
+        maxsize: int | None = 1024,
+        ttl: float | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError('MemoryCache maxsize must be positive int or None.')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('MemoryCache ttl must be positive number or None.')
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is not _MISSING:
+                expire_at, value = item
+                if expire_at is None or expire_at > self._timer():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+
+        expire_at = self._timer() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expire_at, value)
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data), self.ttl)
+
+
+class CachedTranslator(TranslatorWrapper):
+    """Memoize translate_text results by (source text, target language)."""
+
+    def __init__(
+        self,
+        translator: TranslatorBase,
+        maxsize: int | None = 1024,
+        ttl: float | None = None,
+        cache: MemoryCache | None = None,
+    ) -> None:
+
+        super().__init__(translator)
+        self.cache = cache if cache is not None else MemoryCache(maxsize=maxsize, ttl=ttl)
+
+    def translate_text(
+        self, src_text: str, target_lang: str, source_lang: str | None = None
+    ) -> BaseModel:
+
+        key = (src_text, target_lang)
+        result = self.cache.get(key, _MISSING)
+        with observe(
+            'cache',
+            target_lang=target_lang,
+            characters=len(src_text),
+            cache='miss' if result is _MISSING else 'hit',
+        ):
+            if result is _MISSING:
+                # Remote call is done outside of cache lock, concurrent misses
+                # for the same key only cost a duplicated request.
+                result = self.translator.translate_text(
+                    src_text, target_lang, **source_kwargs(source_lang)
+                )
+                self.cache.set(key, result)
+        return result
+
+    def translate_texts(
+        self, texts: list[str], target_lang: str, source_lang: str | None = None
+    ) -> list[BaseModel]:
+
+        results = {}
+        for text in texts:
+            if text not in results:
+                results[text] = self.cache.get((text, target_lang), _MISSING)
+
+        misses = [text for text, result in results.items() if result is _MISSING]
+        if observing() and len(misses) < len(results):
+            hits = [text for text, result in results.items() if result is not _MISSING]
+            record('cache', target_lang=target_lang, characters=sum(map(len, hits)), cache='hit')
+        if misses:
+            with observe(
+                'cache', target_lang=target_lang, characters=sum(map(len, misses)), cache='miss'
+            ):
+                translated = self.translator.translate_texts(
+                    misses, target_lang, **source_kwargs(source_lang)
+                )
+            for text, result in zip(misses, translated):
+                self.cache.set((text, target_lang), result)
+                results[text] = result
+        return [results[text] for text in texts]
+
+    def cache_info(self) -> CacheInfo:
+        return self.cache.info()
+
+    def cache_clear(self) -> None:
+        self.cache.clear()
+
+
+def cached(
+    factory: Callable[[], TranslatorBase],
+    maxsize: int | None = 1024,
+    ttl: float | None = None,
+) -> Callable[[], CachedTranslator]:
+    """
+    Wrap translator factory (get_translator for example) for ExtendMeta.converter
+    or TranslatedField auto param: cached(get_translator, maxsize=2048, ttl=3600).
+    """
+
+    def cached_factory() -> CachedTranslator:
+        return CachedTranslator(factory(), maxsize=maxsize, ttl=ttl)
+
+    cached_factory.__name__ = f'cached_{getattr(factory, "__name__", "translator")}'
+    return cached_factory
+
+
+class DjangoCache:
+    """
+    MemoryCache compatible adapter of django cache backend, for detection results
+    shared by processes (redis, memcached) or persistent (database, file) caches.
+    """
+
+    def __init__(
+        self,
+        alias: str = 'default',
+        timeout: float | None = None,
+        key_prefix: str = 'extends:',
+    ) -> None:
+
+        self.alias = alias
+        self.timeout = timeout
+        self.key_prefix = key_prefix
+
+    @property
+    def backend(self):
+
+        from django.core.cache import caches
+
+        return caches[self.alias]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.backend.get(f'{self.key_prefix}{key}', default)
+
+    def set(self, key: str, value: Any) -> None:
+        self.backend.set(f'{self.key_prefix}{key}', value, self.timeout)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+
+        prefixed = {f'{self.key_prefix}{key}': key for key in keys}
+        return {prefixed[key]: value for key, value in self.backend.get_many(prefixed).items()}
+
+
+def detection_key(text: str) -> str:
+    """Hash of normalized text: unicode NFC form, collapsed whitespace, casefolded."""
+
+    normalized = re.sub(r'\s+', ' ', unicodedata.normalize('NFC', text)).strip().casefold()
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+# Batch result model for language models of known detectors, results of cache
+# hits are built with the same model as upstream batch response.
+_BATCH_MODELS = {
+    AWSLangsModel: AWSBatchLangsModel,
+    TrustedLangs: TrustedBatchLangs,
+    LangsModel: BatchLangsModel,
+}
+
+
+class CachedDetector(LanguageDetectorBase):
+    """
+    Memoize detection results by normalized text hash. Batch calls send only
+    misses upstream. Cache may be MemoryCache, DjangoCache or any object with
+    get(key, default) and set(key, value), values are lists of detector own
+    language models, so hits and misses return the same types.
+    """
+
+    def __init__(
+        self,
+        detector: LanguageDetectorBase,
+        maxsize: int | None = 4096,
+        ttl: float | None = None,
+        cache: Any = None,
+    ) -> None:
+
+        self.detector = detector
+        self.cache = cache if cache is not None else MemoryCache(maxsize=maxsize, ttl=ttl)
+        self._batch_model = None
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            detector = self.__dict__['detector']
+        except KeyError:
+            raise AttributeError(name)
+        return getattr(detector, name)
+
+    def _get_many(self, keys: list[str]) -> dict[str, list[Any]]:
+
+        if hasattr(self.cache, 'get_many'):
+            return self.cache.get_many(keys)
+        return {
+            key: value for key in keys if (value := self.cache.get(key, _MISSING)) is not _MISSING
+        }
+
+    def _detect_misses(self, texts: list[str]) -> list[Any]:
+        """Upstream batch results, detector without batch api is called per text."""
+
+        if hasattr(self.detector, 'batch_detect_languages'):
+            results = self.detector.batch_detect_languages(texts)
+            if results:
+                self._batch_model = type(results[0])
+            return results
+        return [
+            self._batch_result(index, self.detector.detect_languages(text))
+            for index, text in enumerate(texts)
+        ]
+
+    def _batch_result(self, index: int, languages: list[Any]) -> Any:
+
+        model = self._batch_model or (
+            _BATCH_MODELS.get(type(languages[0]), BatchLangsModel) if languages else BatchLangsModel
+        )
+        if issubclass(model, BaseModel):
+            # Languages are already validated models.
+            return model.model_construct(index=index, languages=languages)
+        return model(index=index, languages=languages)
+
+    def detect_languages(self, text: str) -> list[Any]:
+
+        key = detection_key(text)
+        cached = self.cache.get(key, _MISSING)
+        with observe('cache', characters=len(text), cache='miss' if cached is _MISSING else 'hit'):
+            if cached is _MISSING:
+                cached = list(self.detector.detect_languages(text))
+                self.cache.set(key, cached)
+        return list(cached)
+
+    def batch_detect_languages(self, text_list: Iterable[str]) -> list[Any]:
+
+        texts = list(text_list)
+        keys = [detection_key(text) for text in texts]
+        found = self._get_many(list(set(keys)))
+
+        # Every unique missed text is sent once, in order of first appearance.
+        misses = {key: text for key, text in zip(keys, texts) if key not in found}
+        if observing() and len(misses) < len(set(keys)):
+            hits = [text for key, text in zip(keys, texts) if key in found]
+            record('cache', characters=sum(map(len, hits)), cache='hit')
+        if misses:
+            miss_keys = list(misses)
+            with observe('cache', characters=sum(map(len, misses.values())), cache='miss'):
+                results = self._detect_misses(list(misses.values()))
+            for result in results:
+                languages = list(result.languages)
+                self.cache.set(miss_keys[result.index], languages)
+                found[miss_keys[result.index]] = languages
+
+        # Documents failed upstream have not result, as in detector response.
+        return [
+            self._batch_result(index, list(found[key]))
+            for index, key in enumerate(keys)
+            if key in found
+        ]
+
+    def cache_clear(self) -> None:
+        if hasattr(self.cache, 'clear'):
+            self.cache.clear()
+
+
+def cached_detector(
+    factory: Callable[[], LanguageDetectorBase],
+    maxsize: int | None = 4096,
+    ttl: float | None = None,
+    cache: Any = None,
+) -> Callable[[], CachedDetector]:
+    """Wrap detector factory for TranslatedField detector param: cached_detector(get_detector)."""
+
+    def cached_factory() -> CachedDetector:
+        return CachedDetector(factory(), maxsize=maxsize, ttl=ttl, cache=cache)
+
+    cached_factory.__name__ = f'cached_{getattr(factory, "__name__", "detector")}'
+    return cached_factory
@@ -0,0 +1,133 @@
+import os
+import hashlib
+from threading import Lock
+from typing import Any, Callable, Hashable
+
+
+class ClientRegistry:
+    """
+    One api client per credentials and options in process. Clients hold http
+    sessions with connection pools, so fields and translators share them.
+    Forked child (gunicorn, celery prefork) gets empty registry: sockets of
+    parent process must not be reused.
+    """
+
+    def __init__(self) -> None:
+
+        self._clients: dict[Hashable, Any] = {}
+        self._lock = Lock()
+        self._pid = os.getpid()
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+
+        if self._pid != os.getpid():
+            # Fork without register_at_fork support.
+            self.reset()
+        try:
+            return self._clients[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = factory()
+            return self._clients[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+    def reset(self) -> None:
+        """Drop clients without lock, it may be held by thread of parent process."""
+
+        self._clients = {}
+        self._lock = Lock()
+        self._pid = os.getpid()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+registry = ClientRegistry()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=registry.reset)
+
+
+def _credentials_key(*credentials: str | None) -> str:
+    # Registry keys must not keep secrets in plain text.
+    return hashlib.sha256('\x1f'.join(c or '' for c in credentials).encode()).hexdigest()
+
+
+def get_deepl_client(
+    auth_key: str,
+    pool_size: int | None = None,
+    keep_alive: bool = True,
+    **options,
+):
+    """Shared deepl.Translator, pool_size is max connections kept open per host."""
+
+    def factory():
+
+        from deepl import Translator
+        from requests.adapters import HTTPAdapter
+
+        client = Translator(auth_key, **options)
+        # deepl does not expose its requests session settings.
+        if session := getattr(getattr(client, '_client', None), '_session', None):
+            if pool_size:
+                session.mount('https://', HTTPAdapter(pool_maxsize=pool_size))
+            if not keep_alive:
+                session.headers['Connection'] = 'close'
+        return client
+
+    key = (
+        'deepl',
+        _credentials_key(auth_key),
+        pool_size,
+        keep_alive,
+        tuple(sorted(options.items())),
+    )
+    return registry.get(key, factory)
+
+
+def get_boto3_client(
+    client_name: str,
+    region_name: str,
+    aws_access_key_id: str | None,
+    aws_secret_access_key: str | None,
+    pool_size: int | None = None,
+    tcp_keepalive: bool | None = None,
+):
+    """
+    Shared boto3 client, pool_size is botocore max_pool_connections. botocore
+    always reuses http connections of its pool, tcp_keepalive only turns on
+    SO_KEEPALIVE probes of idle sockets, None keeps botocore default.
+    """
+
+    def factory():
+
+        import boto3
+        from botocore.config import Config
+
+        config = {}
+        if pool_size:
+            config['max_pool_connections'] = pool_size
+        if tcp_keepalive is not None:
+            config['tcp_keepalive'] = tcp_keepalive
+        return boto3.client(
+            client_name,
+            region_name=region_name,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            config=Config(**config),
+        )
+
+    key = (
+        'boto3',
+        client_name,
+        region_name,
+        _credentials_key(aws_access_key_id, aws_secret_access_key),
+        pool_size,
+        tcp_keepalive,
+    )
+    return registry.get(key, factory)
@@ -20,3 +20,19 @@ class TranslatorConnectionError(ConnectionErrorBase):
 
 class TranslatorDataError(DataErrorBase):
     pass
+
+
+class TranslatorTimeoutError(TranslatorConnectionError):
+    pass
+
+
+class TranslatorThrottleError(TranslatorConnectionError):
+    pass
+
+
+class DetectorThrottleError(DetectorConnectionError):
+    pass
+
+
+class TranslatorQuotaError(TranslatorConnectionError):
+    pass
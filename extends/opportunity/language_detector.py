@@ -1,14 +1,25 @@
+from __future__ import annotations
+
 import os
-from typing import Any
+from threading import Lock
+from collections import deque
+from contextvars import copy_context
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 from http import HTTPStatus
 
-from botocore.client import BaseClient
-from pydantic import BaseModel, ValidationError, Field
+from functools import lru_cache
+
+from pydantic import BaseModel, ValidationError, Field, TypeAdapter
 
 from extends.exceptions import UndefinedMethodError
+from extends.observers import observe
 from .exceptions import DetectorConnectionError, DetectorDataError
 from .bases import LanguageDetectorBase, ApiHandler
 
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
 
 class LangsModel(BaseModel):
     language: str
@@ -30,12 +41,97 @@ class AWSBatchLangsModel(BatchLangsModel):
     languages: list[AWSLangsModel] = Field(alias="Languages")
 
 
+class TrustedLangs:
+    """Slot-based AWSLangsModel counterpart of trusted mode."""
+
+    __slots__ = ('language', 'probability')
+
+    def __init__(self, language: str, probability: float) -> None:
+
+        self.language = language
+        self.probability = probability
+
+    def model_dump(self) -> dict[str, Any]:
+        return {'language': self.language, 'probability': self.probability}
+
+    def __eq__(self, other: Any) -> bool:
+        if not hasattr(other, 'model_dump'):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
+    def __repr__(self) -> str:
+        return f'TrustedLangs(language={self.language!r}, probability={self.probability!r})'
+
+
+class TrustedBatchLangs:
+    """Slot-based AWSBatchLangsModel counterpart of trusted mode."""
+
+    __slots__ = ('index', 'languages')
+
+    def __init__(self, index: int, languages: list[TrustedLangs]) -> None:
+
+        self.index = index
+        self.languages = languages
+
+    def model_dump(self) -> dict[str, Any]:
+        return {'index': self.index, 'languages': [lang.model_dump() for lang in self.languages]}
+
+    def __eq__(self, other: Any) -> bool:
+        if not hasattr(other, 'model_dump'):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
+    def __repr__(self) -> str:
+        return f'TrustedBatchLangs(index={self.index!r}, languages={self.languages!r})'
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    # One validation call for whole response list instead of one per item.
+    return TypeAdapter(list[schema])
+
+
 class AWSLanguageDetector(LanguageDetectorBase, ApiHandler):
 
-    def __init__(self, client: BaseClient) -> None:
+    # AWS Comprehend limits for one batch_detect_dominant_language request.
+    MAX_BATCH_DOCUMENTS: int = 25
+    MAX_DOCUMENT_SIZE: int = 5000
+    MAX_BATCH_SIZE: int = MAX_BATCH_DOCUMENTS * MAX_DOCUMENT_SIZE
+
+    def __init__(self, client: BaseClient, max_workers: int = 4, trusted: bool = False) -> None:
 
         self.client = client
+        # Trusted mode returns slot-based results without pydantic validation.
+        self.trusted = trusted
         self._exc = self.client.exceptions
+        # Batch chunks are sent concurrently on bounded thread pool.
+        self.max_workers = max_workers
+        self._executor = None
+        self._executor_lock = Lock()
+
+    def get_executor(self) -> ThreadPoolExecutor:
+
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix='extends-detector',
+                    )
+        return self._executor
+
+    @staticmethod
+    def _construct_languages(languages: list[dict]) -> list[TrustedLangs]:
+        return [TrustedLangs(lang['LanguageCode'], lang['Score']) for lang in languages]
+
+    def _construct(self, schema: type[BaseModel], response: list[dict]) -> list[Any]:
+
+        if schema is AWSLangsModel:
+            return self._construct_languages(response)
+        return [
+            TrustedBatchLangs(data['Index'], self._construct_languages(data['Languages']))
+            for data in response
+        ]
 
     def validate_response(self, schema: BaseModel, response: list[dict]) -> list[BaseModel]:
         if not isinstance(response, list):
@@ -43,52 +139,124 @@ class AWSLanguageDetector(LanguageDetectorBase, ApiHandler):
                 'AWSLanguageDetector response is not iterable. Cannot be parse.',
             )
         try:
-            return [schema.model_validate(data) for data in response]
-        except ValidationError as e:
+            if self.trusted and schema in (AWSLangsModel, AWSBatchLangsModel):
+                return self._construct(schema, response)
+            return _list_adapter(schema).validate_python(response)
+        except (ValidationError, KeyError, TypeError) as e:
             raise DetectorDataError(
-                f'AWSLanguageDetector response cant parse to {schema.__class__.__name__}. Pydantic error: {str(e)}' # noqa E501
+                f'AWSLanguageDetector response cant parse to {schema.__name__}. Error: {str(e)}'
             )
 
     def make_request(self, method: str, **kwargs) -> dict[str, Any]:
 
-        try:
-            response = getattr(self.client, method)(**kwargs)
-        except (
-            self._exc.InvalidRequestException,
-            self._exc.InternalServerException,
-        ) as e:
-            raise DetectorConnectionError(
-                f'AWSLanguageDetector request was failed with exception {e}: {e.args}',
-            )
-        except (
-            self._exc.TextSizeLimitExceededException,
-            self._exc.BatchSizeLimitExceededException,
-        ) as e:
-            raise DetectorDataError(
-                f'AWSLanguageDetector get text size over limit. AWS error {e}: {e.args}',
-            )
-        except AttributeError:
-            raise UndefinedMethodError(f'AWS client has not method {method}')
-        resp_meta = response.get('ResponseMetadata')
-        resp_status = resp_meta.get('HTTPStatusCode')
-        if resp_status != HTTPStatus.OK:
-            raise DetectorConnectionError(f'AWS server response status code {resp_status}')
+        text = kwargs.get('Text') or kwargs.get('TextList') or ''
+        characters = len(text) if isinstance(text, str) else sum(map(len, text))
+        with observe('detect', characters=characters):
+            try:
+                response = getattr(self.client, method)(**kwargs)
+            except (
+                self._exc.InvalidRequestException,
+                self._exc.InternalServerException,
+            ) as e:
+                raise DetectorConnectionError(
+                    f'AWSLanguageDetector request was failed with exception {e}: {e.args}',
+                )
+            except (
+                self._exc.TextSizeLimitExceededException,
+                self._exc.BatchSizeLimitExceededException,
+            ) as e:
+                raise DetectorDataError(
+                    f'AWSLanguageDetector get text size over limit. AWS error {e}: {e.args}',
+                )
+            except AttributeError:
+                raise UndefinedMethodError(f'AWS client has not method {method}')
+            resp_meta = response.get('ResponseMetadata')
+            resp_status = resp_meta.get('HTTPStatusCode')
+            if resp_status != HTTPStatus.OK:
+                raise DetectorConnectionError(f'AWS server response status code {resp_status}')
         return response
 
+    def _truncate(self, text: str) -> str:
+        """Cut text to MAX_DOCUMENT_SIZE bytes, partial multibyte char at the end is dropped."""
+
+        encoded = text.encode()
+        if len(encoded) <= self.MAX_DOCUMENT_SIZE:
+            return text
+        return encoded[:self.MAX_DOCUMENT_SIZE].decode(errors='ignore')
+
+    def _chunk_texts(self, texts: Iterable[str]) -> Iterator[tuple[int, list[str]]]:
+        """Split texts by documents count and bytes size, yield (offset, chunk)."""
+
+        chunk, chunk_size, offset = [], 0, 0
+        for text in texts:
+            text = self._truncate(text)
+            text_size = len(text.encode())
+            if chunk and (
+                len(chunk) >= self.MAX_BATCH_DOCUMENTS
+                or chunk_size + text_size > self.MAX_BATCH_SIZE
+            ):
+                yield offset, chunk
+                offset += len(chunk)
+                chunk, chunk_size = [], 0
+            chunk.append(text)
+            chunk_size += text_size
+        if chunk:
+            yield offset, chunk
+
+    def _detect_chunk(self, offset: int, chunk: list[str]) -> list[AWSBatchLangsModel]:
+
+        response = self.make_request('batch_detect_dominant_language', TextList=chunk)
+        results = self.validate_response(AWSBatchLangsModel, response.get('ResultList'))
+        for result in results:
+            # Index of document in the whole input, not in the chunk.
+            result.index += offset
+        return results
+
     def detect_languages(self, text: str) -> list[AWSLangsModel]:
 
-        response = self.make_request('detect_dominant_language', Text=text)
+        response = self.make_request('detect_dominant_language', Text=self._truncate(text))
         return self.validate_response(AWSLangsModel, response.get('Languages'))
 
-    def batch_detect_languages(self, text_list: list[str]):
-        response = self.make_request('batch_detect_dominant_language', TextList=text_list)
-        return self.validate_response(AWSBatchLangsModel, response.get('ResultList'))
+    def iter_batch_detect_languages(self, texts: Iterable[str]) -> Iterator[AWSBatchLangsModel]:
+        """
+        Streaming batch detection for big inputs (queryset.values_list(...).iterator()).
+        At most max_workers chunks are in flight, results are yielded in input order.
+        """
+
+        chunks = self._chunk_texts(texts)
+        if self.max_workers <= 1:
+            for offset, chunk in chunks:
+                yield from self._detect_chunk(offset, chunk)
+            return
+
+        in_flight = deque()
+        for offset, chunk in chunks:
+            in_flight.append(
+                self.get_executor().submit(copy_context().run, self._detect_chunk, offset, chunk)
+            )
+            if len(in_flight) >= self.max_workers:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+    def batch_detect_languages(self, text_list: Iterable[str]) -> list[AWSBatchLangsModel]:
+        return list(self.iter_batch_detect_languages(text_list))
 
 
 def get_detector(
     client_name: str = "comprehend",
     region_name: str = "us-east-1",
+    max_workers: int = 4,
+    pool_size: int | None = None,
+    tcp_keepalive: bool | None = None,
+    trusted: bool = False,
 ) -> AWSLanguageDetector:
+    """boto3 client is shared by every detector with the same credentials in process."""
+
+    from .stand_in import stand_in_options, get_stand_in_detector
+
+    if (options := stand_in_options('detector')) is not None:
+        return get_stand_in_detector(**options)
 
     if not client_name or not region_name:
         raise ValueError(
@@ -108,13 +276,15 @@ def get_detector(
 
     if not required_env:
 
-        import boto3
+        from .clients import get_boto3_client
 
-        client = boto3.client(
+        client = get_boto3_client(
             client_name,
-            region_name=region_name,
-            aws_access_key_id=pub_key,
-            aws_secret_access_key=secret_key,
+            region_name,
+            pub_key,
+            secret_key,
+            pool_size=pool_size,
+            tcp_keepalive=tcp_keepalive,
         )
-        return AWSLanguageDetector(client)
+        return AWSLanguageDetector(client, max_workers=max_workers, trusted=trusted)
     raise AttributeError(f'{required_env} not found in env params.')
@@ -0,0 +1,316 @@
+import json
+import time
+import random
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable
+
+from .bases import TranslatorBase, TranslatorWrapper, LanguageDetectorBase, source_kwargs
+from .translators import TextResultModel
+from .language_detector import LangsModel, BatchLangsModel
+from .exceptions import (
+    TranslatorConnectionError,
+    TranslatorDataError,
+    TranslatorThrottleError,
+    DetectorConnectionError,
+    DetectorDataError,
+    DetectorThrottleError,
+)
+
+
+Distribution = Callable[[random.Random], float]
+
+# Latency distributions by name, settings can use them as ('lognormal', 0.08, 0.5).
+DISTRIBUTIONS: dict[str, Callable[..., Distribution]] = {
+    'constant': lambda value: lambda rng: value,
+    'uniform': lambda low, high: lambda rng: rng.uniform(low, high),
+    'exponential': lambda mean: lambda rng: rng.expovariate(1 / mean),
+    'lognormal': lambda median, sigma: lambda rng: rng.lognormvariate(0, sigma) * median,
+}
+
+
+def distribution(spec: float | Distribution | list | tuple | None) -> Distribution:
+
+    if spec is None:
+        return DISTRIBUTIONS['constant'](0.0)
+    if callable(spec):
+        return spec
+    if isinstance(spec, (int, float)):
+        return DISTRIBUTIONS['constant'](float(spec))
+    name, *args = spec
+    if name not in DISTRIBUTIONS:
+        raise ValueError(f'Unknown latency distribution {name}, use one of {list(DISTRIBUTIONS)}.')
+    return DISTRIBUTIONS[name](*args)
+
+
+class Simulation:
+    """
+    Seeded latency, errors and throttling of one remote request.
+    Same seed and same calls order give the same delays and failures.
+    """
+
+    def __init__(
+        self,
+        latency: float | Distribution | list | tuple | None = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        throttle_latency: float | Distribution | list | tuple | None = None,
+        seed: int | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+
+        self.latency = distribution(latency)
+        self.throttle_latency = distribution(throttle_latency)
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.sleep = sleep
+        self._rng = random.Random(seed)
+        self._lock = Lock()
+
+    def request(self, connection_error: type[Exception], throttle_error: type[Exception]) -> None:
+
+        with self._lock:
+            roll = self._rng.random()
+            throttled = roll < self.throttle_rate
+            failed = not throttled and roll < self.throttle_rate + self.error_rate
+            delay = (self.throttle_latency if throttled else self.latency)(self._rng)
+
+        self.sleep(delay)
+        if throttled:
+            raise throttle_error('Stand-in request was throttled.')
+        if failed:
+            raise connection_error('Stand-in request was failed.')
+
+
+class Recording:
+    """Recorded translator and detector responses stored in json file."""
+
+    def __init__(self, path: str | Path | None = None) -> None:
+
+        self.path = Path(path) if path else None
+        self.translations: dict[str, dict[str, dict]] = {}
+        self.detections: dict[str, list[dict]] = {}
+        self._lock = Lock()
+        if self.path and self.path.exists():
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            self.translations = data.get('translations', {})
+            self.detections = data.get('detections', {})
+
+    def get_translation(self, text: str, target_lang: str) -> dict | None:
+        return self.translations.get(target_lang, {}).get(text)
+
+    def add_translation(self, text: str, target_lang: str, result: dict) -> None:
+        with self._lock:
+            self.translations.setdefault(target_lang, {})[text] = result
+
+    def get_detection(self, text: str) -> list[dict] | None:
+        return self.detections.get(text)
+
+    def add_detection(self, text: str, languages: list[dict]) -> None:
+        with self._lock:
+            self.detections[text] = languages
+
+    def save(self, path: str | Path | None = None) -> None:
+
+        path = Path(path) if path else self.path
+        if not path:
+            raise ValueError('Recording path is not set.')
+        with self._lock:
+            data = {'translations': self.translations, 'detections': self.detections}
+            path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+def _as_recording(recording: Recording | str | Path | None) -> Recording | None:
+    if recording is None or isinstance(recording, Recording):
+        return recording
+    return Recording(recording)
+
+
+class StandInTranslator(TranslatorBase):
+    """
+    Offline translator for load tests. Replays recorded responses, texts missing
+    in recording (or all texts without it) get deterministic pseudo translation
+    "{text} [{target_lang}]" unless strict is set.
+    """
+
+    def __init__(
+        self,
+        simulation: Simulation | None = None,
+        recording: Recording | str | Path | None = None,
+        strict: bool = False,
+        source_lang: str = 'EN',
+    ) -> None:
+
+        self.simulation = simulation or Simulation()
+        self.recording = _as_recording(recording)
+        self.strict = strict
+        self.source_lang = source_lang
+
+    def _result(self, src_text: str, target_lang: str) -> TextResultModel:
+
+        if self.recording and (data := self.recording.get_translation(src_text, target_lang)):
+            return TextResultModel.model_validate(data)
+        if self.strict:
+            raise TranslatorDataError(
+                f'Recording has not translation of {src_text!r} to {target_lang}.'
+            )
+        return TextResultModel(
+            text=f'{src_text} [{target_lang}]',
+            detected_source_lang=self.source_lang,
+        )
+
+    def translate_text(
+        self, src_text: str, target_lang: str, source_lang: str | None = None
+    ) -> TextResultModel:
+
+        self.simulation.request(TranslatorConnectionError, TranslatorThrottleError)
+        return self._result(src_text, target_lang)
+
+    def translate_texts(
+        self, texts: list[str], target_lang: str, source_lang: str | None = None
+    ) -> list[TextResultModel]:
+        # Batch is one simulated request, as for api with batch support.
+        self.simulation.request(TranslatorConnectionError, TranslatorThrottleError)
+        return [self._result(text, target_lang) for text in texts]
+
+
+class RecordingTranslator(TranslatorWrapper):
+    """Store responses of real translator for StandInTranslator replay."""
+
+    def __init__(self, translator: TranslatorBase, recording: Recording | str | Path) -> None:
+
+        super().__init__(translator)
+        self.recording = _as_recording(recording)
+
+    def translate_text(
+        self, src_text: str, target_lang: str, source_lang: str | None = None
+    ) -> TextResultModel:
+
+        result = self.translator.translate_text(src_text, target_lang, **source_kwargs(source_lang))
+        self.recording.add_translation(src_text, target_lang, result.model_dump())
+        return result
+
+    def translate_texts(
+        self, texts: list[str], target_lang: str, source_lang: str | None = None
+    ) -> list[TextResultModel]:
+
+        results = self.translator.translate_texts(texts, target_lang, **source_kwargs(source_lang))
+        for text, result in zip(texts, results):
+            self.recording.add_translation(text, target_lang, result.model_dump())
+        return results
+
+
+class StandInDetector(LanguageDetectorBase):
+    """
+    Offline language detector for load tests. Replays recorded responses, other
+    texts are detected by alphabet: cyrillic is "ru", everything else is "en".
+    """
+
+    def __init__(
+        self,
+        simulation: Simulation | None = None,
+        recording: Recording | str | Path | None = None,
+        strict: bool = False,
+    ) -> None:
+
+        self.simulation = simulation or Simulation()
+        self.recording = _as_recording(recording)
+        self.strict = strict
+
+    def _languages(self, text: str) -> list[LangsModel]:
+
+        if self.recording and (data := self.recording.get_detection(text)) is not None:
+            return [LangsModel.model_validate(lang) for lang in data]
+        if self.strict:
+            raise DetectorDataError(f'Recording has not detection of {text!r}.')
+        cyrillic = sum('Ѐ' <= char <= 'ӿ' for char in text)
+        letters = sum(char.isalpha() for char in text) or 1
+        language = 'ru' if cyrillic * 2 >= letters and cyrillic else 'en'
+        return [LangsModel(language=language, probability=0.99)]
+
+    def detect_languages(self, text: str) -> list[LangsModel]:
+
+        self.simulation.request(DetectorConnectionError, DetectorThrottleError)
+        return self._languages(text)
+
+    def batch_detect_languages(self, text_list: list[str]) -> list[BatchLangsModel]:
+
+        self.simulation.request(DetectorConnectionError, DetectorThrottleError)
+        return [
+            BatchLangsModel(index=index, languages=self._languages(text))
+            for index, text in enumerate(text_list)
+        ]
+
+
+class RecordingDetector(LanguageDetectorBase):
+    """Store responses of real detector for StandInDetector replay."""
+
+    def __init__(self, detector: LanguageDetectorBase, recording: Recording | str | Path) -> None:
+
+        self.detector = detector
+        self.recording = _as_recording(recording)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            detector = self.__dict__['detector']
+        except KeyError:
+            raise AttributeError(name)
+        return getattr(detector, name)
+
+    def detect_languages(self, text: str) -> list[LangsModel]:
+
+        languages = self.detector.detect_languages(text)
+        self.recording.add_detection(text, [lang.model_dump() for lang in languages])
+        return languages
+
+    def batch_detect_languages(self, text_list: list[str]) -> list[BatchLangsModel]:
+
+        results = self.detector.batch_detect_languages(text_list)
+        for result in results:
+            self.recording.add_detection(
+                text_list[result.index], [lang.model_dump() for lang in result.languages]
+            )
+        return results
+
+
+def stand_in_options(kind: str) -> dict[str, Any] | None:
+    """
+    Stand-in options from django settings, for example:
+    EXTENDS_STAND_IN = {
+        'translator': {'latency': ('lognormal', 0.08, 0.5), 'error_rate': 0.01, 'seed': 1},
+        'detector': {'recording': 'responses.json'},
+    }
+    """
+
+    try:
+        from django.conf import settings
+    except ModuleNotFoundError:  # pragma: no cover
+        return None
+    if not settings.configured:
+        return None
+    return (getattr(settings, 'EXTENDS_STAND_IN', None) or {}).get(kind)
+
+
+def _split_options(options: dict[str, Any]) -> tuple[Simulation, dict[str, Any]]:
+
+    options = dict(options)
+    simulation = Simulation(
+        **{
+            key: options.pop(key)
+            for key in ('latency', 'error_rate', 'throttle_rate', 'throttle_latency', 'seed')
+            if key in options
+        }
+    )
+    return simulation, options
+
+
+def get_stand_in_translator(**options) -> StandInTranslator:
+
+    simulation, options = _split_options(options)
+    return StandInTranslator(simulation=simulation, **options)
+
+
+def get_stand_in_detector(**options) -> StandInDetector:
+
+    simulation, options = _split_options(options)
+    return StandInDetector(simulation=simulation, **options)
@@ -0,0 +1,158 @@
+import time
+import random
+from threading import Lock
+from typing import Any, Callable, Iterator
+
+from .exceptions import TranslatorQuotaError
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Tokens are reserved at once, so request bigger
+    than capacity or concurrent requests wait in line instead of starving.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        timer: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+
+        if rate <= 0:
+            raise ValueError('TokenBucket rate must be positive.')
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.timer = timer
+        self.sleep = sleep
+        self._tokens = self.capacity
+        self._updated = timer()
+        self._lock = Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens and return delay before they may be used."""
+
+        with self._lock:
+            now = self.timer()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self, tokens: float = 1) -> None:
+        if delay := self.reserve(tokens):
+            self.sleep(delay)
+
+
+class RateLimiter:
+    """Requests per second and characters per minute limits, may be shared by translators."""
+
+    def __init__(
+        self,
+        requests_per_second: float | None = None,
+        characters_per_minute: float | None = None,
+        timer: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+
+        self.sleep = sleep
+        self.requests = requests_per_second and TokenBucket(requests_per_second, timer=timer)
+        self.characters = characters_per_minute and TokenBucket(
+            characters_per_minute / 60, capacity=characters_per_minute, timer=timer
+        )
+
+    def acquire(self, characters: int = 0) -> None:
+
+        delay = self.requests.reserve() if self.requests else 0.0
+        if self.characters and characters:
+            delay = max(delay, self.characters.reserve(characters))
+        if delay:
+            self.sleep(delay)
+
+
+class Backoff:
+    """Exponential backoff with full jitter for retryable errors."""
+
+    def __init__(
+        self,
+        retries: int = 3,
+        base: float = 0.5,
+        factor: float = 2.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        rng: random.Random | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+
+        self.retries = retries
+        self.base = base
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.rng = rng or random.Random()
+        self.sleep = sleep
+
+    def delays(self) -> Iterator[float]:
+
+        for attempt in range(self.retries):
+            delay = min(self.max_delay, self.base * self.factor ** attempt)
+            yield self.rng.uniform(0, delay) if self.jitter else delay
+
+
+class QuotaGuard:
+    """
+    Cached account usage lookup. Usage is requested at most once per ttl,
+    characters sent since lookup are counted locally. Requests which would go
+    over threshold part of the limit are refused before api does it.
+    """
+
+    def __init__(
+        self,
+        get_usage: Callable[[], Any],
+        ttl: float = 60.0,
+        threshold: float = 1.0,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+
+        self.get_usage = get_usage
+        self.ttl = ttl
+        self.threshold = threshold
+        self.timer = timer
+        self._count = None
+        self._limit = None
+        self._checked = None
+        self._lock = Lock()
+
+    def _refresh(self) -> None:
+
+        now = self.timer()
+        if self._checked is not None and now - self._checked < self.ttl:
+            return
+        # deepl.Usage, character detail may be not valid for some accounts.
+        character = self.get_usage().character
+        self._count, self._limit = character.count, character.limit
+        self._checked = now
+
+    def check(self, characters: int) -> None:
+
+        with self._lock:
+            self._refresh()
+            if self._count is None or self._limit is None:
+                return
+            if self._count + characters > self._limit * self.threshold:
+                raise TranslatorQuotaError(
+                    f'Translation of {characters} characters exceeds quota, '
+                    f'used {self._count} of {self._limit}.'
+                )
+
+    def consume(self, characters: int) -> None:
+
+        with self._lock:
+            if self._count is not None:
+                self._count += characters
+
+    def invalidate(self) -> None:
+
+        with self._lock:
+            self._checked = None
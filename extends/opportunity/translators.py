@@ -1,12 +1,21 @@
 import os
+import re
+from typing import Any, Iterator
 
 from deepl.translator import Translator
 from deepl.api_data import TextResult
-from deepl.exceptions import ConnectionException
+from deepl.exceptions import ConnectionException, TooManyRequestsException, QuotaExceededException
 from pydantic import BaseModel, ValidationError
 
+from extends.observers import observe
 from .bases import TranslatorBase, ApiHandler
-from .exceptions import TranslatorConnectionError, TranslatorDataError
+from .throttling import RateLimiter, Backoff, QuotaGuard
+from .exceptions import (
+    TranslatorConnectionError,
+    TranslatorDataError,
+    TranslatorThrottleError,
+    TranslatorQuotaError,
+)
 
 
 class TextResultModel(BaseModel):
@@ -15,6 +24,34 @@ class TextResultModel(BaseModel):
     detected_source_lang: str
 
 
+class TrustedTextResult:
+    """
+    Slot-based TextResultModel counterpart of trusted mode. pydantic model_construct
+    is slower than validation itself, so plain object is used.
+    """
+
+    __slots__ = ('text', 'detected_source_lang')
+
+    def __init__(self, text: str, detected_source_lang: str) -> None:
+
+        self.text = text
+        self.detected_source_lang = detected_source_lang
+
+    def model_dump(self) -> dict[str, str]:
+        return {'text': self.text, 'detected_source_lang': self.detected_source_lang}
+
+    def __eq__(self, other: Any) -> bool:
+        if not hasattr(other, 'model_dump'):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
+    def __repr__(self) -> str:
+        return (
+            f'TrustedTextResult(text={self.text!r}, '
+            f'detected_source_lang={self.detected_source_lang!r})'
+        )
+
+
 class DeeplTranslator(TranslatorBase, ApiHandler):
 
     LANGUAGE_MAPPER: dict[str, str] = {
@@ -22,9 +59,18 @@ class DeeplTranslator(TranslatorBase, ApiHandler):
         'ru': 'RU',
         'de': 'DE',
     }
+    # Deepl api limits for one /translate request.
+    MAX_TEXTS_PER_REQUEST: int = 50
+    MAX_REQUEST_SIZE: int = 128 * 1024
+
+    def __init_subclass__(cls, **kwargs) -> None:
+
+        super().__init_subclass__(**kwargs)
+        cls._validate_language_mapper()
 
     @classmethod
-    def _get_language_mapper(cls):
+    def _validate_language_mapper(cls) -> None:
+        """Run once at class creation, not on every translation."""
 
         assert hasattr(cls, 'LANGUAGE_MAPPER'), (
             'Cls attr LANGUAGE_MAPPER must be set for mapping django '
@@ -36,17 +82,35 @@ class DeeplTranslator(TranslatorBase, ApiHandler):
             for key, value in cls.LANGUAGE_MAPPER.items()
         ), 'Type items in cls attr LANGUAGE_MAPPER must be str.'
 
+    @classmethod
+    def _get_language_mapper(cls):
         return cls.LANGUAGE_MAPPER
 
-    def __init__(self, translator: Translator) -> None:
+    def __init__(
+        self,
+        translator: Translator,
+        rate_limiter: RateLimiter | None = None,
+        backoff: Backoff | None = None,
+        quota: QuotaGuard | None = None,
+        trusted: bool = False,
+    ) -> None:
 
         self.translator = translator
+        self.rate_limiter = rate_limiter
+        # Without backoff failed request is not retried.
+        self.backoff = backoff
+        self.quota = quota
+        # deepl TextResult fields are typed already, trusted mode skips pydantic
+        # validation and returns TrustedTextResult.
+        self.trusted = trusted
 
-    def validate_response(self, response: TextResult) -> TextResultModel:
+    def validate_response(self, response: TextResult) -> TextResultModel | TrustedTextResult:
 
         if not isinstance(response, TextResult):
             raise TranslatorDataError('Deepl response must be TextResult instance.')
 
+        if self.trusted:
+            return TrustedTextResult(response.text, response.detected_source_lang)
         try:
             return TextResultModel(
                 text=response.text,
@@ -57,46 +121,155 @@ class DeeplTranslator(TranslatorBase, ApiHandler):
                 f'Deepl response data cant parse to TextResultModel. Pudantic error: {str(e)}'
             )
 
-    def make_request(self, *args, **kwargs) -> TextResult:
-        try:
-            response = self.translator.translate_text(*args, **kwargs)
-        except ConnectionException as e:
-            raise TranslatorConnectionError(
-                f'DeeplTranslator request was failed with exception {e}: {e.args}',
-            )
+    def _send(self, text: str | list[str], characters: int, **kwargs) -> TextResult:
+
+        if self.rate_limiter:
+            self.rate_limiter.acquire(characters)
+        with observe('translate', target_lang=kwargs.get('target_lang'), characters=characters):
+            try:
+                return self.translator.translate_text(text, **kwargs)
+            except TooManyRequestsException as e:
+                raise TranslatorThrottleError(
+                    f'DeeplTranslator request was throttled with exception {e}: {e.args}',
+                )
+            except QuotaExceededException as e:
+                if self.quota:
+                    self.quota.invalidate()
+                raise TranslatorQuotaError(
+                    f'DeeplTranslator quota was exceeded with exception {e}: {e.args}',
+                )
+            except ConnectionException as e:
+                raise TranslatorConnectionError(
+                    f'DeeplTranslator request was failed with exception {e}: {e.args}',
+                )
+
+    def make_request(self, text: str | list[str], **kwargs) -> TextResult:
+
+        characters = len(text) if isinstance(text, str) else sum(map(len, text))
+        if self.quota:
+            self.quota.check(characters)
+
+        delays = self.backoff.delays() if self.backoff else iter(())
+        while True:
+            try:
+                response = self._send(text, characters, **kwargs)
+            except TranslatorQuotaError:
+                raise
+            except TranslatorConnectionError:
+                # Throttled and connection errors are retried while backoff has delays.
+                if (delay := next(delays, None)) is None:
+                    raise
+                self.backoff.sleep(delay)
+                continue
+            break
+
+        if self.quota:
+            self.quota.consume(characters)
         return response
 
-    def translate_text(self, src_text: str, target_lang: str) -> TextResultModel:
+    def _get_deepl_lang_code(self, target_lang: str) -> str:
+
+        mapper = self._get_language_mapper()
+        if deepl_lang_code := mapper.get(target_lang):
+            return deepl_lang_code
+
+        # TODO: сделать метод с re.
+        target_lang = (
+            target_lang.replace("_", "-")
+            if "_" in target_lang
+            else target_lang.replace("-", "_")
+        )
+        if deepl_lang_code := mapper.get(target_lang):
+            return deepl_lang_code
+        raise TranslatorDataError(
+            f'Target language does not exists in LANGUAGE_MAPPER. {target_lang}'
+        )
+
+    def _chunk_texts(self, texts: list[str]) -> Iterator[list[str]]:
+
+        chunk, chunk_size = [], 0
+        for text in texts:
+            text_size = len(text.encode())
+            if chunk and (
+                len(chunk) >= self.MAX_TEXTS_PER_REQUEST
+                or chunk_size + text_size > self.MAX_REQUEST_SIZE
+            ):
+                yield chunk
+                chunk, chunk_size = [], 0
+            chunk.append(text)
+            chunk_size += text_size
+        if chunk:
+            yield chunk
 
-        deepl_lang_code = self._get_language_mapper().get(target_lang)
+    def _source_kwargs(self, source_lang: str | None) -> dict[str, str]:
+        # Deepl source languages are without variant: EN, PT, not EN-US.
+        if not source_lang:
+            return {}
+        return {'source_lang': re.split('[-_]', source_lang)[0].upper()}
 
-        if not deepl_lang_code:
-            # TODO: сделать метод с re.
-            target_lang = (
-                target_lang.replace("_", "-")
-                if "_" in target_lang
-                else target_lang.replace("-", "_")
+    def translate_text(
+        self, src_text: str, target_lang: str, source_lang: str | None = None
+    ) -> TextResultModel:
+
+        deepl_lang_code = self._get_deepl_lang_code(target_lang)
+        response = self.make_request(
+            src_text, target_lang=deepl_lang_code, **self._source_kwargs(source_lang)
+        )
+        return self.validate_response(response)
+
+    def translate_texts(
+        self, texts: list[str], target_lang: str, source_lang: str | None = None
+    ) -> list[TextResultModel]:
+
+        deepl_lang_code = self._get_deepl_lang_code(target_lang)
+        results = []
+        for chunk in self._chunk_texts(texts):
+            response = self.make_request(
+                chunk, target_lang=deepl_lang_code, **self._source_kwargs(source_lang)
             )
-            if deepl_lang_code := self._get_language_mapper().get(target_lang):
-                pass
-            else:
+            if not isinstance(response, list) or len(response) != len(chunk):
                 raise TranslatorDataError(
-                    f'Target language does not exists in LANGUAGE_MAPPER. {deepl_lang_code}'
+                    f'Deepl batch response must be list of {len(chunk)} TextResult.'
                 )
+            results.extend(self.validate_response(item) for item in response)
+        return results
+
+
+DeeplTranslator._validate_language_mapper()
 
-        response = self.make_request(src_text, target_lang=deepl_lang_code)
-        self.validate_response(response)
-        return self.validate_response(response)
 
+def get_translator(
+    rate_limiter: RateLimiter | None = None,
+    backoff: Backoff | None = None,
+    quota_ttl: float | None = None,
+    quota_threshold: float = 1.0,
+    pool_size: int | None = None,
+    keep_alive: bool = True,
+    trusted: bool = False,
+) -> DeeplTranslator:
+    """
+    Used it in your ExtendField parametrs if you need DeeplTranslator, wrap it
+    with functools.partial for rate limiting, retries, quota check and connection pool.
+    deepl client is shared by every translator with the same key in process.
+    With settings.EXTENDS_STAND_IN['translator'] offline StandInTranslator is returned.
+    """
 
-def get_translator() -> DeeplTranslator:
-    """Used it in your ExtendField parametrs if you need DeeplTranslator."""
+    from .stand_in import stand_in_options, get_stand_in_translator
+
+    if (options := stand_in_options('translator')) is not None:
+        return get_stand_in_translator(**options)
 
     if key := os.getenv("DEEPL_TRANSLATOR_KEY"):
 
-        from deepl import Translator
+        from .clients import get_deepl_client
 
-        deepl_translator = DeeplTranslator(Translator(key))
+        client = get_deepl_client(key, pool_size=pool_size, keep_alive=keep_alive)
+        quota = None
+        if quota_ttl is not None:
+            quota = QuotaGuard(client.get_usage, ttl=quota_ttl, threshold=quota_threshold)
+        deepl_translator = DeeplTranslator(
+            client, rate_limiter=rate_limiter, backoff=backoff, quota=quota, trusted=trusted
+        )
         return deepl_translator
     else:
         raise AttributeError('DEEPL_TRANSLATOR_KEY not found in env params.')
@@ -10,6 +10,7 @@ class Question(models.Model):
     question = TranslatedField(
         models.CharField(_("question"), max_length=200),
         auto=([], []),
+        source_hash=True,
     )
     answer = TranslatedField(
         models.CharField(_("answer"), max_length=200),
@@ -0,0 +1,38 @@
+import pytest
+
+from testapp.models import Question
+from testapp.tests.translated_field_tests.factories import QuestionFactory
+
+try:
+    import pytest_benchmark  # noqa
+except ModuleNotFoundError:  # pragma: no cover
+    # Benchmarks need dev dependency pytest-benchmark.
+    collect_ignore_glob = ['test_*.py']
+
+
+def pytest_collection_modifyitems(config, items):
+
+    # Benchmarks are slow (import rounds spawn interpreters), plain pytest run skips them.
+    if config.getoption('benchmark_only', False):
+        return
+    skip = pytest.mark.skip(reason='benchmark, run with pytest --benchmark-only')
+    for item in items:
+        if 'benchmark' in getattr(item, 'fixturenames', ()):
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def saved_questions(db):
+    return Question.objects.bulk_create(
+        [
+            Question(
+                question_en_us=f'q{i}', question_ru=f'в{i}', question_de=f'f{i}', answer=f'a{i}'
+            )
+            for i in range(100)
+        ]
+    )
+
+
+@pytest.fixture
+def question_factory(fake_converter):
+    return QuestionFactory
@@ -0,0 +1,58 @@
+"""
+Hot paths of TranslatedField descriptor with offline translator.
+
+    pytest testapp/testapp/tests/benchmarks --benchmark-only --benchmark-autosave
+    pytest testapp/testapp/tests/benchmarks --benchmark-only --benchmark-compare
+"""
+
+from itertools import count
+
+import pytest
+from django.utils.translation import override
+
+from testapp.models import Question
+
+
+@pytest.mark.benchmark(group='getter')
+@pytest.mark.parametrize('language', ('en-us', 'ru', 'de'))
+def test_getter(benchmark, language):
+
+    objs = [
+        Question(question_en_us=f'q{i}', question_ru=f'в{i}', question_de=f'f{i}')
+        for i in range(1000)
+    ]
+
+    def read():
+        for obj in objs:
+            obj.question
+
+    with override(language):
+        benchmark(read)
+
+
+@pytest.mark.benchmark(group='setter')
+def test_setter_without_auto(benchmark):
+
+    obj = Question()
+
+    def write():
+        obj.answer = 'answer'
+
+    benchmark(write)
+
+
+@pytest.mark.benchmark(group='setter')
+def test_setter_with_auto(benchmark, fake_converter):
+
+    obj, rounds = Question(), count()
+
+    # New value every round, unchanged source is not translated at all.
+    def write():
+        obj.question = f'question {next(rounds)}'
+
+    benchmark(write)
+
+
+@pytest.mark.benchmark(group='construction')
+def test_factory_build(benchmark, question_factory):
+    benchmark(question_factory.build, question='question', answer='answer')
@@ -0,0 +1,19 @@
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import extends
+
+
+@pytest.mark.benchmark(group='import')
+def test_import_extends(benchmark):
+
+    # New interpreter for every round, in-process import is cached by sys.modules.
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, '-c', 'import extends'],),
+        kwargs={'check': True, 'cwd': Path(extends.__file__).resolve().parent.parent},
+        rounds=5,
+    )
@@ -0,0 +1,29 @@
+from itertools import count
+
+import pytest
+
+from testapp.models import Question
+
+
+@pytest.mark.benchmark(group='manager')
+def test_update(benchmark, fake_converter, saved_questions):
+
+    rounds = count()
+
+    # New value every round, update with unchanged source skips translation.
+    def update():
+        Question.objects.update(question=f'question {next(rounds)}', answer='answer')
+
+    benchmark(update)
+
+
+@pytest.mark.benchmark(group='manager')
+def test_bulk_create(benchmark, db, fake_converter):
+
+    rows = [{'question': f'q{i % 10}', 'answer': f'a{i}'} for i in range(100)]
+    benchmark(Question.objects.bulk_create, rows)
+
+
+@pytest.mark.benchmark(group='manager')
+def test_filter_translated_name(benchmark, saved_questions):
+    benchmark(lambda: list(Question.objects.filter(question__startswith='q1')))
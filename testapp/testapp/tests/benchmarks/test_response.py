@@ -0,0 +1,24 @@
+import pytest
+
+from extends.opportunity import DeeplTranslator, AWSLanguageDetector
+from testapp.tests.translator_tests.test_detector_batch import FakeComprehendClient
+
+
+@pytest.mark.benchmark(group='response')
+@pytest.mark.parametrize('trusted', (False, True))
+def test_deepl_translate_texts(benchmark, fake_deepl_client, trusted):
+
+    translator = DeeplTranslator(fake_deepl_client, trusted=trusted)
+    texts = [f'text {i}' for i in range(1000)]
+
+    benchmark(translator.translate_texts, texts, 'ru')
+
+
+@pytest.mark.benchmark(group='response')
+@pytest.mark.parametrize('trusted', (False, True))
+def test_aws_batch_detect(benchmark, trusted):
+
+    detector = AWSLanguageDetector(FakeComprehendClient(), max_workers=1, trusted=trusted)
+    texts = [f'en{i}' for i in range(1000)]
+
+    benchmark(detector.batch_detect_languages, texts)
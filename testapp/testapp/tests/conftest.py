@@ -0,0 +1,72 @@
+from threading import Lock
+
+import pytest
+
+from extends.opportunity import TranslatorBase, TextResultModel
+
+
+class FakeTranslator(TranslatorBase):
+    """
+    Offline translator which counts remote calls. Calls wait on gate (threading
+    Barrier or Event) if it is set, peak is max number of calls in flight.
+    """
+
+    def __init__(self, gate=None) -> None:
+        self.calls = []
+        self.source_langs = []
+        self.gate = gate
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = Lock()
+
+    def translate_text(
+        self, src_text: str, target_lang: str, source_lang: str | None = None
+    ) -> TextResultModel:
+        self.calls.append((src_text, target_lang))
+        self.source_langs.append(source_lang)
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.gate is not None:
+                self.gate.wait(timeout=5)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        return TextResultModel(text=f'{src_text} [{target_lang}]', detected_source_lang='EN')
+
+
+@pytest.fixture
+def fake_translator():
+    return FakeTranslator()
+
+
+@pytest.fixture
+def fake_converter(monkeypatch, fake_translator):
+    """Replace Question.question ExtendMeta converter with offline translator."""
+
+    from testapp.models import Question
+
+    monkeypatch.setattr(Question.question, 'converter', fake_translator)
+    return fake_translator
+
+
+class FakeDeeplClient:
+    """Imitate deepl.Translator.translate_text without network."""
+
+    def __init__(self) -> None:
+        self.requests = []
+
+    def translate_text(self, text, *, target_lang, **kwargs):
+
+        from deepl.api_data import TextResult
+
+        self.requests.append(text)
+        if isinstance(text, str):
+            return TextResult(f'{text} [{target_lang}]', 'EN', len(text))
+        return [TextResult(f'{t} [{target_lang}]', 'EN', len(t)) for t in text]
+
+
+@pytest.fixture
+def fake_deepl_client():
+    return FakeDeeplClient()
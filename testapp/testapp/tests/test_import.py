@@ -0,0 +1,53 @@
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+import extends
+
+# Backends which must be loaded only when translator or detector is used.
+HEAVY_MODULES = ('deepl', 'botocore', 'boto3', 'pydantic')
+# Generous wall time of "import extends, extends.fields" in fresh interpreter, seconds.
+IMPORT_TIME_BUDGET = 1.5
+
+SCRIPT = f'''
+import sys, json, time
+start = time.perf_counter()
+import extends, extends.fields
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [m for m in {HEAVY_MODULES!r} if m in sys.modules]]))
+'''
+
+
+def run_script(script: str) -> list:
+
+    result = subprocess.run(
+        [sys.executable, '-c', script],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=Path(extends.__file__).resolve().parent.parent,
+    )
+    return json.loads(result.stdout)
+
+
+class TestImportBudget:
+
+    def test_heavy_backends_are_lazy(self):
+
+        elapsed, loaded = run_script(SCRIPT)
+
+        assert loaded == [], f'import extends must not load {loaded}.'
+        assert elapsed < IMPORT_TIME_BUDGET, (
+            f'import extends took {elapsed:.3f}s, budget is {IMPORT_TIME_BUDGET}s.'
+        )
+
+    def test_public_names_resolved_on_access(self):
+
+        loaded = run_script(
+            'import sys, json, extends; extends.MemoryCache; extends.TranslatedField; '
+            f'print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))'
+        )
+
+        assert 'deepl' not in loaded, 'Access to one name must not import other backends.'
+        assert set(extends.__all__) <= set(dir(extends))
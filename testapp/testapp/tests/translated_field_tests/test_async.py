@@ -0,0 +1,55 @@
+import pytest
+from asgiref.sync import async_to_sync
+
+from testapp.models import Question
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncManager:
+
+    def test_acreate(self, fake_converter):
+
+        q = async_to_sync(Question.objects.acreate)(question='hello', answer='answer')
+        q.refresh_from_db()
+
+        for suf in Question.question.auto.suffix:
+            column = Question.question.to_attribute('question', suf)
+            assert getattr(q, column) == f'hello [{suf}]', f'acreate set wrong {column} value.'
+        assert q.answer == 'answer', 'acreate must set not auto translated fields.'
+
+    def test_aupdate(self, fake_converter):
+
+        q = Question.objects.create(question_en_us='hi', answer='answer')
+        count = async_to_sync(Question.objects.aupdate)(question='hello')
+        q.refresh_from_db()
+
+        assert count == 1, 'aupdate must return updated rows count.'
+        assert q.question_de == 'hello [de]', 'aupdate must translate auto fields.'
+
+    def test_abulk_create(self, fake_converter):
+
+        rows = [{'question': text, 'answer': 'a'} for text in ('yes', 'no', 'yes')]
+        async_to_sync(Question.objects.abulk_create)(rows)
+
+        assert Question.objects.count() == 3, 'abulk_create must insert all objects.'
+        assert set(Question.objects.values_list('question_ru', flat=True)) == {
+            'yes [ru]', 'no [ru]'
+        }, 'abulk_create must translate deferred values.'
+        assert len(fake_converter.calls) == 2 * len(Question.question.auto.suffix), (
+            f'abulk_create must translate unique texts once, {fake_converter.calls}'
+        )
+
+    def test_abulk_create_keeps_raw_columns(self, fake_converter):
+
+        async_to_sync(Question.objects.abulk_create)([Question(question_en_us='yes')])
+
+        assert not fake_converter.calls, 'Like bulk_create, raw columns are not translated.'
+        assert Question.objects.get().question_ru == ''
+
+    def test_async_translator(self, fake_translator):
+
+        result = async_to_sync(fake_translator.atranslate_text)('hello', 'ru')
+        results = async_to_sync(fake_translator.atranslate_texts)(['a', 'b'], 'de')
+
+        assert result.text == 'hello [ru]', 'atranslate_text must return translate_text result.'
+        assert [r.text for r in results] == ['a [de]', 'b [de]'], 'Wrong atranslate_texts result.'
@@ -0,0 +1,144 @@
+import pytest
+from django.core.management import call_command
+
+from extends.fields import BACKGROUND
+from extends.jobs.models import TranslationJob
+from extends.jobs.worker import TranslationWorker
+from testapp.models import Question
+
+
+class BrokenTranslator:
+
+    def translate_texts(self, texts, target_lang):
+        raise ConnectionError('translator is down')
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBackgroundTranslation:
+
+    @pytest.fixture(autouse=True)
+    def background_field(self, monkeypatch, fake_converter):
+        monkeypatch.setattr(Question.question, 'auto_mode', BACKGROUND)
+
+    def test_save_enqueue_job(self, fake_converter):
+
+        q = Question.objects.create(question='hello', answer='answer')
+
+        assert not fake_converter.calls, 'Background mode must not translate on save.'
+        assert q.question_en_us == 'hello', 'Active language column must be saved.'
+        job = TranslationJob.objects.get()
+        assert (job.field, job.object_pk, job.target_suffixes) == (
+            'question',
+            str(q.pk),
+            ['ru', 'de'],
+        ), f'Wrong translation job {job}'
+        assert TranslationJob.objects.depth() == 1, 'Queue depth must count pending jobs.'
+
+    def test_drain_command(self, fake_converter):
+
+        objs = [
+            Question.objects.create(question=text, answer='a') for text in ('yes', 'no', 'yes')
+        ]
+        call_command('drain_translations', '--batch-size', '10')
+
+        assert not TranslationJob.objects.exists(), 'Processed jobs must be removed from queue.'
+        for obj in objs:
+            obj.refresh_from_db()
+            assert (
+                obj.question_ru == f'{obj.question_en_us} [ru]'
+            ), 'Worker must save translations.'
+        assert (
+            len(fake_converter.calls) == 4
+        ), f'Unique texts must be translated once per language, {fake_converter.calls}'
+
+    def test_retry(self, monkeypatch):
+
+        Question.objects.create(question='hello', answer='answer')
+        monkeypatch.setattr(Question.question, 'converter', BrokenTranslator())
+        stats = TranslationWorker(max_attempts=2, retry_delay=0).drain(max_batches=1)
+        job = TranslationJob.objects.get()
+
+        assert stats.failed == 1, 'Failed job must be counted.'
+        assert (job.status, job.attempts) == (
+            TranslationJob.Status.PENDING,
+            1,
+        ), 'Failed job must return to queue.'
+        TranslationWorker(max_attempts=2, retry_delay=0).drain()
+        job.refresh_from_db()
+        assert job.status == TranslationJob.Status.FAILED, 'Job must fail after max_attempts.'
+
+    def test_update_enqueue_jobs(self, fake_converter):
+
+        objs = [Question.objects.create(question=text, answer='a') for text in ('yes', 'no')]
+        TranslationJob.objects.all().delete()
+        Question.objects.update(question='hello')
+
+        assert not fake_converter.calls, 'Background update must not translate.'
+        assert set(Question.objects.values_list('question_en_us', 'question_ru')) == {
+            ('hello', ''),
+        }, 'Update must write only active language column.'
+        assert sorted(TranslationJob.objects.values_list('object_pk', flat=True)) == sorted(
+            str(obj.pk) for obj in objs
+        ), 'Update must enqueue job for every updated row.'
+        TranslationWorker().drain()
+        assert Question.objects.filter(question_ru='hello [ru]').count() == 2
+
+    def test_async_enqueue_jobs(self, fake_converter):
+
+        from asgiref.sync import async_to_sync
+
+        q = async_to_sync(Question.objects.acreate)(question='hello', answer='a')
+        async_to_sync(Question.objects.aupdate)(question='bye')
+
+        assert not fake_converter.calls, 'Background acreate and aupdate must not translate.'
+        assert list(TranslationJob.objects.values_list('object_pk', flat=True)) == [
+            str(q.pk),
+            str(q.pk),
+        ], 'acreate and aupdate must enqueue jobs.'
+        TranslationWorker().drain()
+        q.refresh_from_db()
+        assert (q.question_en_us, q.question_de) == ('bye', 'bye [de]')
+
+    def test_broken_job_does_not_fail_batch(self, fake_converter):
+
+        q = Question.objects.create(question='hello', answer='a')
+        TranslationJob.objects.bulk_create(
+            [
+                TranslationJob(model='testapp.removed', object_pk='1', field='question'),
+                TranslationJob(model='testapp.question', object_pk=str(q.pk), field='removed'),
+            ]
+        )
+        stats = TranslationWorker(max_attempts=1).drain()
+        q.refresh_from_db()
+
+        assert (stats.processed, stats.failed) == (1, 2), f'Wrong drain stats {stats}'
+        assert q.question_ru == 'hello [ru]', 'Valid job of the batch must be translated.'
+        assert set(TranslationJob.objects.values_list('status', flat=True)) == {
+            TranslationJob.Status.FAILED
+        }, 'Broken jobs must be failed through retry bookkeeping.'
+
+    def test_update_revert_before_drain(self, fake_converter):
+
+        Question.objects.create(question='hello', answer='a')
+        TranslationWorker().drain()
+        Question.objects.update(question='bye')
+        Question.objects.update(question='hello')
+        TranslationWorker().drain()
+        q = Question.objects.get()
+
+        assert (q.question_en_us, q.question_ru) == ('hello', 'hello [ru]'), (
+            'Reverted value must not be skipped as unchanged before worker drain.'
+        )
+
+    def test_aupdate_revert_before_drain(self, fake_converter):
+
+        from asgiref.sync import async_to_sync
+
+        Question.objects.create(question='hello', answer='a')
+        TranslationWorker().drain()
+        async_to_sync(Question.objects.aupdate)(question='bye')
+        async_to_sync(Question.objects.aupdate)(question='hello')
+        TranslationWorker().drain()
+        q = Question.objects.get()
+
+        assert (q.question_en_us, q.question_de) == ('hello', 'hello [de]')
@@ -0,0 +1,85 @@
+import pytest
+from asgiref.sync import async_to_sync
+
+from extends.fields import defer_translation
+from testapp.models import Question
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBulkCreate:
+
+    def test_bulk_create_mappings(self, fake_converter):
+
+        rows = [{'question': text, 'answer': 'a'} for text in ('yes', 'no', 'yes')]
+        Question.objects.bulk_create(rows)
+
+        assert sorted(Question.objects.values_list('question_de', flat=True)) == [
+            'no [de]', 'yes [de]', 'yes [de]'
+        ], 'bulk_create must fill auto suffix columns.'
+        assert len(fake_converter.calls) == 2 * len(Question.question.auto.suffix), (
+            f'Unique texts must be translated once per language, {fake_converter.calls}'
+        )
+
+    def test_bulk_create_deferred_instances(self, fake_converter):
+
+        with defer_translation():
+            objs = [Question(question=text, answer='a') for text in ('yes', 'no')]
+
+        assert not fake_converter.calls, 'Setter must not translate inside defer_translation.'
+        Question.objects.bulk_create(objs)
+
+        assert [obj.question_ru for obj in objs] == ['yes [ru]', 'no [ru]'], (
+            'bulk_create must translate deferred values.'
+        )
+
+    def test_abulk_create_mappings(self, fake_converter):
+
+        async_to_sync(Question.objects.abulk_create)([{'question': 'yes', 'answer': 'a'}])
+
+        assert Question.objects.get().question_ru == 'yes [ru]', (
+            'abulk_create must translate mappings values.'
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBulkUpdate:
+
+    def test_bulk_update_translate_changed(self, fake_converter):
+
+        Question.objects.bulk_create([{'question': text, 'answer': 'a'} for text in ('yes', 'no')])
+        objs = list(Question.objects.order_by('id'))
+        fake_converter.calls.clear()
+
+        with defer_translation():
+            objs[0].question = objs[0].question_en_us
+            objs[1].question = 'maybe'
+        Question.objects.bulk_update(objs, fields=['question', 'answer'], batch_size=1)
+
+        assert {text for text, _ in fake_converter.calls} == {'maybe'}, (
+            f'Only changed source must be translated, {fake_converter.calls}'
+        )
+        assert list(Question.objects.order_by('id').values_list('question_ru', flat=True)) == [
+            'yes [ru]',
+            'maybe [ru]',
+        ], 'bulk_update must write every suffix column.'
+
+    def test_bulk_update_saves_source_hash(self, fake_converter):
+
+        q = Question.objects.create(question='hello', answer='a')
+        with defer_translation():
+            q.question = 'bye'
+        Question.objects.bulk_update([q], fields=['question'])
+        Question.objects.update(question='hello')
+        q.refresh_from_db()
+
+        assert (q.question_en_us, q.question_ru) == ('hello [en-us]', 'hello [ru]'), (
+            'Update with the previous source must not be skipped after bulk_update.'
+        )
+
+    def test_bulk_update_not_auto_field(self):
+
+        q = Question.objects.create(question_en_us='q', answer='a')
+        q.answer = 'b'
+        Question.objects.bulk_update([q], fields=['answer'])
+
+        assert Question.objects.get().answer == 'b', 'bulk_update must expand translated names.'
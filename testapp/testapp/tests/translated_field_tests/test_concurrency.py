@@ -0,0 +1,63 @@
+from threading import Barrier, Event
+
+import pytest
+
+from extends.opportunity.exceptions import TranslatorTimeoutError
+from testapp.models import Question
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentTranslation:
+
+    @pytest.fixture
+    def concurrent_field(self, monkeypatch, fake_converter):
+
+        desc = Question.question
+        monkeypatch.setattr(desc, 'auto_workers', len(desc.auto.suffix))
+        monkeypatch.setattr(desc, '_executor', None)
+        # Every call waits for all others: sequential translation breaks barrier.
+        fake_converter.gate = Barrier(len(desc.auto.suffix))
+        yield desc
+        if desc._executor:
+            desc._executor.shutdown()
+
+    def test_setter_translate_concurrently(self, concurrent_field, fake_converter):
+
+        q = Question(question='hello')
+
+        assert fake_converter.peak == len(concurrent_field.auto.suffix), (
+            f'Suffixes must be translated concurrently, peak in flight {fake_converter.peak}'
+        )
+        for suf in concurrent_field.auto.suffix:
+            assert getattr(q, concurrent_field.to_attribute('question', suf)) == f'hello [{suf}]', (
+                f'Concurrent translation assigned wrong value to {suf} column.'
+            )
+
+    def test_update_translate_concurrently(self, concurrent_field, fake_converter):
+
+        q = Question.objects.create(question='hi', answer='answer')
+        fake_converter.peak = 0
+        Question.objects.update(question='hello')
+        q.refresh_from_db()
+
+        assert fake_converter.peak == len(concurrent_field.auto.suffix), (
+            f'Update must translate suffixes concurrently, peak in flight {fake_converter.peak}'
+        )
+
+        for suf in concurrent_field.auto.suffix:
+            column = concurrent_field.to_attribute('question', suf)
+            assert getattr(q, column) == f'hello [{suf}]', (
+                f'Concurrent update assigned wrong value to {column} column.'
+            )
+
+    def test_timeout(self, monkeypatch, concurrent_field, fake_converter):
+
+        # Calls are held until translation is timed out.
+        fake_converter.gate = release = Event()
+        monkeypatch.setattr(concurrent_field, 'auto_timeout', 0.05)
+
+        try:
+            with pytest.raises(TranslatorTimeoutError):
+                Question(question='hello')
+        finally:
+            release.set()
@@ -0,0 +1,45 @@
+import pytest
+from django.utils.translation import override
+
+from extends.fields import DEFERRED
+from testapp.models import Question
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDeferredTranslation:
+
+    @pytest.fixture(autouse=True)
+    def deferred_field(self, monkeypatch, fake_converter):
+        monkeypatch.setattr(Question.question, 'auto_mode', DEFERRED)
+
+    def test_setter_does_not_translate(self, fake_converter):
+
+        with override('ru'):
+            q = Question()
+            q.question = 'first'
+            q.question = 'second'
+
+            assert q.question == 'second', 'Deferred setter must set active language column.'
+        assert not fake_converter.calls, 'Deferred setter must not call translator.'
+
+    def test_translate_once_on_save(self, fake_converter):
+
+        q = Question(question='first', answer='answer')
+        q.question = 'second'
+        q.save()
+        q.refresh_from_db()
+
+        for suf in Question.question.auto.suffix:
+            column = Question.question.to_attribute('question', suf)
+            assert getattr(q, column) == f'second [{suf}]', f'Wrong {column} value after save.'
+        assert len(fake_converter.calls) == len(Question.question.auto.suffix), (
+            f'Only last value must be translated once, calls {fake_converter.calls}'
+        )
+
+    def test_resave_without_changes(self, fake_converter):
+
+        q = Question.objects.create(question='hello', answer='answer')
+        calls = len(fake_converter.calls)
+        q.save()
+
+        assert len(fake_converter.calls) == calls, 'Translated values must not be sent again.'
@@ -0,0 +1,89 @@
+import pytest
+from asgiref.sync import async_to_sync
+
+from extends.opportunity import StandInDetector
+from testapp.models import Question
+
+
+class CountingDetector(StandInDetector):
+
+    def __init__(self, probability: float = 0.99) -> None:
+        super().__init__()
+        self.batches = []
+        self.probability = probability
+
+    def _languages(self, text):
+        languages = super()._languages(text)
+        for lang in languages:
+            lang.probability = self.probability
+        return languages
+
+    def batch_detect_languages(self, text_list):
+        self.batches.append(list(text_list))
+        return super().batch_detect_languages(text_list)
+
+
+@pytest.fixture
+def detector(monkeypatch, fake_converter):
+
+    detector = CountingDetector()
+    monkeypatch.setattr(Question.question, 'detector_factory', lambda: detector)
+    monkeypatch.setattr(Question.question, '_detector', None)
+    return detector
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDetectorGatedTranslation:
+
+    def test_setter_copy_source_language(self, detector, fake_converter):
+
+        q = Question(question='привет', answer='a')
+
+        assert q.question_ru == 'привет', 'Text in detected language must be copied as is.'
+        assert {lang for _, lang in fake_converter.calls} == {'en-us', 'de'}
+        assert set(fake_converter.source_langs) == {'ru'}, (
+            'Detected language must be passed to translator.'
+        )
+        assert len(detector.batches) == 1
+
+    def test_primary_language_match(self, detector, fake_converter):
+
+        q = Question(question='hello', answer='a')
+
+        assert q.question_en_us == 'hello', 'Detected "en" must match "en-us" suffix.'
+        assert q.question_ru == 'hello [ru]'
+
+    def test_low_probability_translate_all(self, detector, fake_converter):
+
+        detector.probability = 0.1
+        Question(question='hello', answer='a')
+
+        assert len(fake_converter.calls) == len(Question.question.auto.suffix)
+        assert set(fake_converter.source_langs) == {None}
+
+    def test_bulk_create_one_detection(self, detector, fake_converter):
+
+        objs = Question.objects.bulk_create(
+            [{'question': text, 'answer': 'a'} for text in ('hello', 'привет', 'hello')]
+        )
+
+        assert [sorted(batch) for batch in detector.batches] == [['hello', 'привет']], (
+            f'Unique texts must be detected with one batch, {detector.batches}'
+        )
+        assert [obj.question_ru for obj in objs] == ['hello [ru]', 'привет', 'hello [ru]']
+        assert [obj.question_en_us for obj in objs] == ['hello', 'привет [en-us]', 'hello']
+
+    def test_update(self, detector, fake_converter):
+
+        Question.objects.create(question='x', answer='a')
+        Question.objects.update(question='привет')
+
+        q = Question.objects.get()
+        assert (q.question_ru, q.question_de) == ('привет', 'привет [de]')
+
+    def test_aupdate(self, detector, fake_converter):
+
+        Question.objects.create(question='x', answer='a')
+        async_to_sync(Question.objects.aupdate)(question='привет')
+
+        assert Question.objects.get().question_ru == 'привет'
@@ -0,0 +1,73 @@
+import pytest
+from django.utils.translation import override
+
+from extends.fields import Translated
+from testapp.models import Question
+
+
+@pytest.fixture
+def fallback_plan(monkeypatch):
+
+    desc = Question.answer
+    monkeypatch.setattr(desc, 'fallback', {'de': ['ru', 'en-us']})
+    monkeypatch.setattr(desc, 'plan', desc._create_plan('answer'))
+    return desc.plan
+
+
+@pytest.fixture
+def answers():
+    return Question.objects.bulk_create(
+        [
+            Question(question_en_us='1', answer_en_us='b-en', answer_ru='', answer_de=''),
+            Question(question_en_us='2', answer_en_us='c-en', answer_ru='a-ru', answer_de=''),
+            Question(question_en_us='3', answer_en_us='x-en', answer_ru='x-ru', answer_de='d-de'),
+        ]
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFallback:
+
+    def test_plan(self, fallback_plan):
+
+        assert fallback_plan.fallbacks['de'] == ('answer_de', 'answer_ru', 'answer_en_us'), (
+            f'Wrong precomputed fallback chain {fallback_plan.fallbacks}'
+        )
+
+    def test_getter(self, fallback_plan, answers):
+
+        with override('de'):
+            assert [obj.answer for obj in answers] == ['b-en', 'a-ru', 'd-de'], (
+                'Getter must return first not empty column of fallback chain.'
+            )
+        with override('ru'):
+            assert answers[0].answer == '', 'Language without chain must not fallback.'
+
+    def test_translated_expression(self, fallback_plan, answers, django_assert_num_queries):
+
+        with override('de'), django_assert_num_queries(1):
+            result = list(
+                Question.objects.annotate(effective=Translated('answer'))
+                .order_by('effective')
+                .values_list('effective', flat=True)
+            )
+
+        assert result == ['a-ru', 'b-en', 'd-de'], f'Coalesce must sort by effective value {result}'
+
+    def test_current_language_only(self, fallback_plan, answers, django_assert_num_queries):
+
+        with override('de'):
+            objs = list(Question.objects.current_language_only().order_by('id'))
+            deferred = objs[0].get_deferred_fields()
+
+            assert not {'answer_de', 'answer_ru', 'answer_en_us'} & deferred, (
+                'Fallback chain columns must not be deferred.'
+            )
+            with django_assert_num_queries(0):
+                assert [obj.answer for obj in objs] == ['b-en', 'a-ru', 'd-de']
+
+    def test_wrong_fallback_language(self, monkeypatch):
+
+        monkeypatch.setattr(Question.answer, 'fallback', {'de': ['fr']})
+        with pytest.raises(ValueError):
+            Question.answer._create_plan('answer')
@@ -0,0 +1,49 @@
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+from extends.bases import LazyConverter
+from testapp.models import Question
+
+
+class TestLazyConverter:
+
+    def test_resolved_once_on_first_use(self, monkeypatch, fake_translator):
+
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return fake_translator
+
+        monkeypatch.setattr(Question.question, 'converter', LazyConverter(factory))
+        assert calls == [], 'Converter must not be built before use.'
+
+        assert Question.question.auto.converter is fake_translator
+        assert Question.question.auto.converter is fake_translator
+        assert calls == [1], 'Converter must be built once and cached.'
+
+    def test_model_import_without_api_key(self):
+
+        env = {k: v for k, v in os.environ.items() if k != 'DEEPL_TRANSLATOR_KEY'}
+        project = Path(__file__).resolve().parents[3]
+        script = (
+            'import django; django.setup(); '
+            'from testapp.models import Question; '
+            'from extends.opportunity.clients import registry; '
+            'from django.core.management import call_command; '
+            'call_command("check"); '
+            'assert len(registry) == 0, "Model import must not build api clients."'
+        )
+        subprocess.run(
+            [sys.executable, '-c', script],
+            check=True,
+            capture_output=True,
+            cwd=project,
+            env={
+                **env,
+                'DJANGO_SETTINGS_MODULE': 'core.settings',
+                'PYTHONPATH': os.pathsep.join([str(project), str(project.parent)]),
+            },
+        )
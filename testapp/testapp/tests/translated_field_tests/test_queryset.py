@@ -0,0 +1,99 @@
+import pytest
+from django.db.models import Q
+from django.utils.translation import override
+
+from testapp.models import Question
+
+
+@pytest.fixture
+def questions():
+    return Question.objects.bulk_create(
+        [
+            Question(
+                question_en_us='apple', question_ru='яблоко', answer_en_us='a', answer_ru='я'
+            ),
+            Question(question_en_us='pear', question_ru='груша', answer_en_us='b', answer_ru='г'),
+        ]
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+class TestTranslatedQuerySet:
+
+    @pytest.mark.parametrize(
+        'language, lookup, expect',
+        [('en-us', 'app', 'apple'), ('ru', 'груш', 'груша')],
+    )
+    def test_filter(self, questions, language, lookup, expect):
+
+        with override(language):
+            result = Question.objects.filter(question__icontains=lookup).get()
+
+            assert result.question == expect, f'filter must use {language} column.'
+            assert (
+                Question.objects.exclude(Q(question__icontains=lookup)).count() == 1
+            ), 'exclude must translate Q objects.'
+            assert Question.objects.get(question=expect) == result, 'get must translate lookups.'
+
+    def test_order_by(self, questions):
+
+        with override('ru'):
+            assert list(
+                Question.objects.order_by('-question').values_list('question', flat=True)
+            ) == [
+                'яблоко',
+                'груша',
+            ], 'order_by and values_list must use active language column.'
+
+    def test_values(self, questions):
+
+        with override('ru'):
+            assert list(Question.objects.order_by('id').values('question', 'answer')) == [
+                {'question': 'яблоко', 'answer': 'я'},
+                {'question': 'груша', 'answer': 'г'},
+            ], 'values must keep translated names as keys.'
+
+    def test_only_defer(self, questions):
+
+        with override('ru'):
+            obj = Question.objects.only('question').first()
+            deferred = obj.get_deferred_fields()
+            assert (
+                'question_ru' not in deferred and 'question_en_us' in deferred
+            ), 'only must load active language column only.'
+            obj = Question.objects.defer('answer').first()
+            assert (
+                set(Question.answer.fields) <= obj.get_deferred_fields()
+            ), 'defer must skip every column of translated name.'
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCurrentLanguageOnly:
+
+    def test_defer_other_languages(self, questions):
+
+        with override('ru'):
+            obj = Question.objects.current_language_only().first()
+
+        assert obj.get_deferred_fields() == {
+            'question_en_us', 'question_de', 'answer_en_us', 'answer_de'
+        }, 'current_language_only must defer not active languages columns.'
+
+    def test_language_switch(self, questions, django_assert_num_queries):
+
+        with override('ru'):
+            obj = Question.objects.current_language_only().order_by('id').first()
+
+        with override('en-us'), django_assert_num_queries(1):
+            assert obj.question == 'apple', 'Deferred column must be loaded on language switch.'
+        with override('de'), django_assert_num_queries(0):
+            obj.question
+
+    def test_extend_meta_default(self, monkeypatch, questions):
+
+        monkeypatch.setattr(Question.objects, 'current_language_default', True)
+
+        with override('ru'):
+            assert 'question_en_us' in Question.objects.first().get_deferred_fields(), (
+                'ExtendMeta.current_language_only must be applied by default manager.'
+            )
@@ -0,0 +1,147 @@
+import pytest
+
+from testapp.models import Question
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSourceHash:
+
+    def test_same_value_translated_once(self, fake_converter):
+
+        q = Question(question='hello', answer='a')
+        calls = len(fake_converter.calls)
+        q.question = 'hello'
+
+        assert len(fake_converter.calls) == calls, 'Unchanged source must not be translated.'
+        q.question = 'bye'
+        assert len(fake_converter.calls) == 2 * calls, 'Changed source must be translated.'
+
+    def test_hash_persisted(self, fake_converter):
+
+        Question.objects.create(question='hello', answer='a')
+        q = Question.objects.get()
+        fake_converter.calls.clear()
+        q.question = 'hello'
+        q.save()
+
+        assert fake_converter.calls == [], 'Re-save of loaded object must not translate.'
+
+    def test_empty_target_translated(self, fake_converter):
+
+        q = Question(question='hello', answer='a')
+        q.question_de = ''
+        fake_converter.calls.clear()
+        q.question = 'hello'
+
+        assert q.question_de == 'hello [de]', 'Empty target column must be translated.'
+
+    def test_instance_hash_without_column(self, monkeypatch, fake_converter):
+
+        monkeypatch.setattr(Question.question, 'source_hash_column', None)
+        q = Question(question='hello', answer='a')
+        calls = len(fake_converter.calls)
+        q.question = 'hello'
+
+        assert len(fake_converter.calls) == calls
+        assert 'question' in q._translation_source_hashes
+
+    def test_update_same_value(self, fake_converter):
+
+        Question.objects.create(question='hello', answer='a')
+        Question.objects.update(question='bye')
+        fake_converter.calls.clear()
+        Question.objects.update(question='bye')
+
+        assert fake_converter.calls == [], 'Update with the same source must not translate.'
+        assert Question.objects.get().question_ru == 'bye [ru]'
+
+    def test_resave_shown_value_in_other_language(self, fake_converter):
+
+        from django.utils.translation import override
+
+        Question.objects.create(question='hello', answer='a')
+        q = Question.objects.get()
+        fake_converter.calls.clear()
+        with override('ru'):
+            q.question = q.question
+
+        assert fake_converter.calls == [], 'Value of active language column is unchanged.'
+        assert q.question_en_us == 'hello [en-us]'
+
+    def test_aupdate_same_value(self, fake_converter):
+
+        from asgiref.sync import async_to_sync
+
+        Question.objects.create(question='hello', answer='a')
+        async_to_sync(Question.objects.aupdate)(question='bye')
+        fake_converter.calls.clear()
+        async_to_sync(Question.objects.aupdate)(question='bye')
+
+        assert fake_converter.calls == [], 'aupdate with the same source must not translate.'
+        assert Question.objects.get().question_ru == 'bye [ru]'
+
+    def test_deferred_hash_after_translation(self, monkeypatch, fake_converter):
+
+        from extends.fields import DEFERRED, translate_pending
+
+        monkeypatch.setattr(Question.question, 'auto_mode', DEFERRED)
+        q = Question(question='hello', answer='a')
+
+        assert not q.question_source_hash, 'Hash must not be set before translation.'
+        translate_pending([q])
+        assert q.question_source_hash, 'Hash must be set after translation.'
+
+    def test_background_hash_after_worker(self, monkeypatch, fake_converter):
+
+        from extends.fields import BACKGROUND
+        from extends.jobs.worker import TranslationWorker
+
+        monkeypatch.setattr(Question.question, 'auto_mode', BACKGROUND)
+        Question.objects.create(question='hello', answer='a')
+
+        assert not Question.objects.get().question_source_hash
+        TranslationWorker().drain()
+        assert Question.objects.get().question_source_hash, 'Worker must save source hash.'
+
+    def test_background_update_is_not_translated(self, monkeypatch, fake_converter):
+
+        from extends.fields import BACKGROUND
+
+        Question.objects.create(question='hello', answer='a')
+        monkeypatch.setattr(Question.question, 'auto_mode', BACKGROUND)
+        Question.objects.update(question='bye')
+        q = Question.objects.get()
+
+        assert (q.question_en_us, q.question_ru) == ('bye', 'hello [ru]')
+        assert not Question.question.is_translated(q, 'bye'), (
+            'Active column of background write is not translated to other languages.'
+        )
+        assert not Question.question.is_translated(q, 'hello'), (
+            'Previous source must not match after background write.'
+        )
+
+    def test_column_update_clears_hash(self, fake_converter):
+
+        Question.objects.create(question='hello', answer='a')
+        Question.objects.update(question_ru='привет')
+        Question.objects.update(question='hello')
+
+        assert Question.objects.get().question_ru == 'hello [ru]', (
+            'Update after direct column write must translate again.'
+        )
+
+    def test_bulk_update_then_same_value(self, fake_converter):
+
+        from extends.fields import defer_translation
+
+        q = Question.objects.create(question='hello', answer='a')
+        with defer_translation():
+            q.question = 'bye'
+        Question.objects.bulk_update([q], fields=['question'])
+        q = Question.objects.get()
+        fake_converter.calls.clear()
+        q.question = 'bye'
+
+        assert fake_converter.calls == [], 'Hash saved by bulk_update must mark source translated.'
+        q.question = 'hello'
+        assert q.question_ru == 'hello [ru]', 'Previous source must be translated again.'
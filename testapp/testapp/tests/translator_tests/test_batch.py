@@ -0,0 +1,55 @@
+import pytest
+
+from extends.opportunity import DeeplTranslator, CachedTranslator
+from extends.memory.translators import MemoryTranslator
+
+
+class TestDeeplBatchTranslation:
+
+    def test_translate_texts_keep_order(self, fake_deepl_client):
+
+        texts = [f'text {i}' for i in range(120)]
+        results = DeeplTranslator(fake_deepl_client).translate_texts(texts, 'ru')
+
+        assert [r.text for r in results] == [f'{t} [RU]' for t in texts], (
+            'Batch translation must keep texts order.'
+        )
+        assert [len(r) for r in fake_deepl_client.requests] == [50, 50, 20], (
+            'Batch must be chunked by MAX_TEXTS_PER_REQUEST.'
+        )
+
+    def test_chunk_by_request_size(self, fake_deepl_client):
+
+        translator = DeeplTranslator(fake_deepl_client)
+        translator.MAX_REQUEST_SIZE = 10
+        translator.translate_texts(['12345', '12345', '1'], 'de')
+
+        assert fake_deepl_client.requests == [['12345', '12345'], ['1']], (
+            f'Batch must be chunked by MAX_REQUEST_SIZE, {fake_deepl_client.requests}'
+        )
+
+    def test_base_translate_texts(self, fake_translator):
+
+        results = fake_translator.translate_texts(['a', 'b'], 'ru')
+
+        assert [r.text for r in results] == ['a [ru]', 'b [ru]'], (
+            'TranslatorBase.translate_texts must fallback to translate_text.'
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+class TestWrappersBatchTranslation:
+
+    @pytest.mark.parametrize('wrapper', (CachedTranslator, MemoryTranslator))
+    def test_only_misses_sent_upstream(self, wrapper, fake_deepl_client):
+
+        translator = wrapper(DeeplTranslator(fake_deepl_client))
+        translator.translate_text('Yes', 'ru')
+        results = translator.translate_texts(['Yes', 'No', 'No', 'Maybe'], 'ru')
+
+        assert [r.text for r in results] == ['Yes [RU]', 'No [RU]', 'No [RU]', 'Maybe [RU]'], (
+            'Wrapper must merge stored and translated results by position.'
+        )
+        assert fake_deepl_client.requests[-1] == ['No', 'Maybe'], (
+            f'Only unique misses must be sent upstream, {fake_deepl_client.requests}'
+        )
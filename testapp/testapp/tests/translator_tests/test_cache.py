@@ -0,0 +1,72 @@
+import pytest
+
+from extends.opportunity import CachedTranslator, MemoryCache, cached
+
+
+class FakeTimer:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachedTranslator:
+
+    def test_repeated_text_translated_once(self, fake_translator):
+
+        translator = CachedTranslator(fake_translator)
+        first = translator.translate_text('Yes', 'ru')
+        second = translator.translate_text('Yes', 'ru')
+
+        assert first == second, 'Cached translator must return the same result.'
+        assert fake_translator.calls == [('Yes', 'ru')], (
+            f'Repeated text must be translated once, calls {fake_translator.calls}'
+        )
+        info = translator.cache_info()
+        assert (info.hits, info.misses) == (1, 1), f'Wrong cache counters {info}'
+
+    def test_key_contains_target_language(self, fake_translator):
+
+        translator = CachedTranslator(fake_translator)
+        translator.translate_text('Yes', 'ru')
+        translator.translate_text('Yes', 'de')
+
+        assert len(fake_translator.calls) == 2, 'Cache key must contain target language.'
+
+    def test_lru_eviction(self, fake_translator):
+
+        translator = CachedTranslator(fake_translator, maxsize=2)
+        for text in ('a', 'b', 'a', 'c', 'a', 'b'):
+            translator.translate_text(text, 'ru')
+
+        assert fake_translator.calls == [('a', 'ru'), ('b', 'ru'), ('c', 'ru'), ('b', 'ru')], (
+            f'Least recently used key must be evicted, calls {fake_translator.calls}'
+        )
+
+    def test_ttl_eviction(self, fake_translator):
+
+        timer = FakeTimer()
+        translator = CachedTranslator(fake_translator, cache=MemoryCache(ttl=10, timer=timer))
+        translator.translate_text('Yes', 'ru')
+        timer.now = 9
+        translator.translate_text('Yes', 'ru')
+        timer.now = 11
+        translator.translate_text('Yes', 'ru')
+
+        assert len(fake_translator.calls) == 2, 'Expired key must be translated again.'
+
+    @pytest.mark.parametrize('kwargs', ({'maxsize': 0}, {'ttl': -1}))
+    def test_wrong_params(self, kwargs):
+
+        with pytest.raises(ValueError):
+            MemoryCache(**kwargs)
+
+    def test_cached_factory(self, fake_translator):
+
+        translator = cached(lambda: fake_translator, maxsize=10)()
+
+        assert isinstance(translator, CachedTranslator), 'cached must build CachedTranslator.'
+        assert translator.cache_info().maxsize == 10, 'cached must pass cache params.'
+        assert translator.translator is fake_translator, 'cached must wrap factory result.'
@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+from extends.opportunity import get_translator, get_detector, get_deepl_client
+from extends.opportunity.clients import registry
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    registry.clear()
+    yield
+    registry.clear()
+
+
+class TestClientRegistry:
+
+    def test_translators_share_client(self, monkeypatch):
+
+        monkeypatch.setenv('DEEPL_TRANSLATOR_KEY', 'key')
+        first, second = get_translator(), get_translator()
+
+        assert first is not second
+        assert first.translator is second.translator, 'Translators must share deepl client.'
+        assert get_deepl_client('other') is not first.translator, (
+            'Other credentials must get own client.'
+        )
+
+    def test_deepl_pool_options(self):
+
+        client = get_deepl_client('key', pool_size=32, keep_alive=False)
+        session = client._client._session
+
+        assert session.get_adapter('https://api.deepl.com')._pool_maxsize == 32
+        assert session.headers['Connection'] == 'close'
+
+    def test_detectors_share_client(self, monkeypatch):
+
+        monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'id')
+        monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'secret')
+        first, second = get_detector(pool_size=16), get_detector(pool_size=16)
+
+        assert first.client is second.client
+        assert first.client.meta.config.max_pool_connections == 16
+
+    def test_boto3_tcp_keepalive(self):
+
+        from extends.opportunity.clients import get_boto3_client
+
+        default = get_boto3_client('comprehend', 'us-east-1', 'id', 'secret')
+        probes = get_boto3_client('comprehend', 'us-east-1', 'id', 'secret', tcp_keepalive=True)
+
+        assert not default.meta.config.tcp_keepalive, 'botocore default must be kept.'
+        assert probes.meta.config.tcp_keepalive, 'tcp_keepalive must be passed to botocore.'
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='fork is not supported')
+    def test_reset_after_fork(self):
+
+        get_deepl_client('key')
+        assert len(registry) == 1
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            os._exit(len(registry))
+        _, status = os.waitpid(pid, 0)
+
+        assert os.waitstatus_to_exitcode(status) == 0, 'Child process must not reuse clients.'
+        assert len(registry) == 1
@@ -0,0 +1,121 @@
+import pytest
+
+from extends.opportunity import CachedDetector, DjangoCache, MemoryCache, StandInDetector
+from extends.opportunity.bases import LanguageDetectorBase
+from extends.opportunity.language_detector import AWSLangsModel, AWSBatchLangsModel
+
+
+class CountingDetector(StandInDetector):
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def detect_languages(self, text):
+        self.calls.append(text)
+        return super().detect_languages(text)
+
+    def batch_detect_languages(self, text_list):
+        self.calls.append(list(text_list))
+        return super().batch_detect_languages(text_list)
+
+
+class AWSLikeDetector(LanguageDetectorBase):
+    """Return AWS response models like AWSLanguageDetector, without network."""
+
+    def detect_languages(self, text):
+        return [AWSLangsModel(LanguageCode='en', Score=0.9)]
+
+    def batch_detect_languages(self, text_list):
+        return [
+            AWSBatchLangsModel(Index=index, Languages=[{'LanguageCode': 'en', 'Score': 0.9}])
+            for index, _ in enumerate(text_list)
+        ]
+
+
+class SingleTextDetector(LanguageDetectorBase):
+    """Detector without batch api."""
+
+    def __init__(self):
+        self.calls = []
+
+    def detect_languages(self, text):
+        self.calls.append(text)
+        return [AWSLangsModel(LanguageCode='de', Score=0.8)]
+
+
+@pytest.fixture
+def detector():
+    return CountingDetector()
+
+
+class TestCachedDetector:
+
+    def test_normalized_text_detected_once(self, detector):
+
+        cached = CachedDetector(detector)
+        first = cached.detect_languages('Hello  world')
+        second = cached.detect_languages(' hello world\n')
+
+        assert first == second
+        assert detector.calls == ['Hello  world'], 'Normalized text must hit cache.'
+
+    def test_batch_sends_only_misses(self, detector):
+
+        cached = CachedDetector(detector)
+        cached.detect_languages('привет')
+        results = cached.batch_detect_languages(['hello', 'привет', 'hello', 'bye'])
+
+        assert detector.calls[1] == ['hello', 'bye'], f'Only unique misses expected, {detector.calls}'
+        assert [r.index for r in results] == [0, 1, 2, 3]
+        assert [r.languages[0].language for r in results] == ['en', 'ru', 'en', 'en']
+
+        cached.batch_detect_languages(['bye', 'hello'])
+        assert len(detector.calls) == 2, 'Batch of cached texts must not call detector.'
+
+    def test_ttl(self, detector):
+
+        clock = [0.0]
+        cached = CachedDetector(detector, cache=MemoryCache(ttl=10, timer=lambda: clock[0]))
+        cached.detect_languages('hello')
+        clock[0] = 11
+        cached.detect_languages('hello')
+
+        assert len(detector.calls) == 2, 'Expired result must be detected again.'
+
+    def test_django_cache_backend(self, detector):
+
+        from django.core.cache import cache
+
+        cache.clear()
+        CachedDetector(detector, cache=DjangoCache()).batch_detect_languages(['hello'])
+        other_process = CountingDetector()
+        results = CachedDetector(other_process, cache=DjangoCache()).batch_detect_languages(
+            ['hello', 'привет']
+        )
+
+        assert [r.languages[0].language for r in results] == ['en', 'ru']
+        assert other_process.calls == [['привет']], 'Shared backend results must be reused.'
+
+    def test_hit_returns_detector_models(self):
+
+        cached = CachedDetector(AWSLikeDetector())
+        miss, hit = cached.detect_languages('hello'), cached.detect_languages('hello')
+        (batch_miss,) = cached.batch_detect_languages(['bye'])
+        batch_hit = cached.batch_detect_languages(['hello', 'bye'])
+
+        assert type(hit[0]) is type(miss[0]) is AWSLangsModel, 'Hit must keep detector model.'
+        assert type(batch_miss) is AWSBatchLangsModel
+        assert [type(r) for r in batch_hit] == [AWSBatchLangsModel] * 2
+        assert [r.index for r in batch_hit] == [0, 1]
+        assert type(batch_hit[0].languages[0]) is AWSLangsModel
+
+    def test_detector_without_batch(self):
+
+        detector = SingleTextDetector()
+        cached = CachedDetector(detector)
+        results = cached.batch_detect_languages(['hallo', 'welt', 'hallo'])
+
+        assert detector.calls == ['hallo', 'welt'], 'Unique misses must be detected per text.'
+        assert [r.index for r in results] == [0, 1, 2]
+        assert [r.languages[0].language for r in results] == ['de'] * 3
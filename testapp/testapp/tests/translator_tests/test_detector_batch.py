@@ -0,0 +1,82 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from extends.opportunity import AWSLanguageDetector
+
+
+class FakeComprehendClient:
+    """Imitate boto3 comprehend client limits without network."""
+
+    exceptions = SimpleNamespace(
+        **{
+            name: type(name, (Exception,), {})
+            for name in (
+                'InvalidRequestException',
+                'InternalServerException',
+                'TextSizeLimitExceededException',
+                'BatchSizeLimitExceededException',
+            )
+        }
+    )
+
+    def __init__(self):
+        self.requests = []
+        self.threads = set()
+
+    def batch_detect_dominant_language(self, TextList):
+
+        self.requests.append(TextList)
+        self.threads.add(threading.get_ident())
+        if len(TextList) > 25:
+            raise self.exceptions.BatchSizeLimitExceededException()
+        if any(len(text.encode()) > 5000 for text in TextList):
+            raise self.exceptions.TextSizeLimitExceededException()
+        return {
+            'ResultList': [
+                {'Index': index, 'Languages': [{'LanguageCode': text[:2], 'Score': 0.9}]}
+                for index, text in enumerate(TextList)
+            ],
+            'ResponseMetadata': {'HTTPStatusCode': 200},
+        }
+
+
+@pytest.fixture
+def client():
+    return FakeComprehendClient()
+
+
+class TestBatchDetectLanguages:
+
+    def test_chunks_and_index_remapping(self, client):
+
+        texts = [f'{code}-{i}' for i, code in enumerate(['en', 'ru', 'de'] * 20)]
+        results = AWSLanguageDetector(client).batch_detect_languages(iter(texts))
+
+        assert [len(request) for request in client.requests] == [25, 25, 10]
+        assert [result.index for result in results] == list(range(60)), (
+            'Indexes must point to positions in the whole input.'
+        )
+        assert [result.languages[0].language for result in results] == [t[:2] for t in texts]
+
+    def test_chunk_by_bytes_and_truncate(self, client):
+
+        detector = AWSLanguageDetector(client)
+        texts = ['ж' * 4000, 'en' + 'x' * 10, 'ж' * 2000]
+        detector.MAX_BATCH_SIZE = 6000
+        results = detector.batch_detect_languages(texts)
+
+        assert [len(request) for request in client.requests] == [2, 1]
+        assert client.requests[0][0] == 'ж' * 2500, 'Text must be cut at utf-8 char boundary.'
+        assert len(results) == 3
+
+    def test_streaming_sequential(self, client):
+
+        detector = AWSLanguageDetector(client, max_workers=1)
+        stream = detector.iter_batch_detect_languages(f'en{i}' for i in range(30))
+
+        assert next(stream).index == 0
+        assert len(client.requests) == 1, 'Stream must request chunks lazily.'
+        assert [result.index for result in stream][-1] == 29
+        assert client.threads == {threading.get_ident()}
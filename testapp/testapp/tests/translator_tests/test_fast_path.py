@@ -0,0 +1,65 @@
+import pytest
+
+from extends.opportunity import DeeplTranslator, AWSLanguageDetector, AWSBatchLangsModel
+from extends.opportunity.exceptions import DetectorDataError
+
+from .test_detector_batch import FakeComprehendClient
+
+
+class TestDeeplFastPath:
+
+    def test_mapper_validated_at_class_creation(self):
+
+        with pytest.raises(AssertionError):
+
+            class BrokenTranslator(DeeplTranslator):
+                LANGUAGE_MAPPER = {'ru': 1}
+
+    def test_mapper_not_validated_per_call(self, monkeypatch, fake_deepl_client):
+
+        def fail():
+            raise AssertionError('Mapper must not be validated on translation.')
+
+        monkeypatch.setattr(DeeplTranslator, '_validate_language_mapper', fail)
+        assert DeeplTranslator(fake_deepl_client).translate_text('a', 'en-us').text == 'a [EN-US]'
+
+    def test_response_validated_once(self, monkeypatch, fake_deepl_client):
+
+        translator = DeeplTranslator(fake_deepl_client)
+        calls = []
+        validate = translator.validate_response
+        monkeypatch.setattr(
+            translator, 'validate_response', lambda response: calls.append(1) or validate(response)
+        )
+        translator.translate_text('a', 'ru')
+
+        assert calls == [1]
+
+    def test_trusted_results_equal(self, fake_deepl_client):
+
+        texts = ['a', 'b']
+        trusted = DeeplTranslator(fake_deepl_client, trusted=True).translate_texts(texts, 'ru')
+        validated = DeeplTranslator(fake_deepl_client).translate_texts(texts, 'ru')
+
+        assert [r.model_dump() for r in trusted] == [r.model_dump() for r in validated]
+
+
+class TestAWSFastPath:
+
+    def test_trusted_results_equal(self):
+
+        texts = [f'en{i}' for i in range(30)]
+        trusted = AWSLanguageDetector(FakeComprehendClient(), trusted=True)
+        validated = AWSLanguageDetector(FakeComprehendClient())
+
+        assert [r.model_dump() for r in trusted.batch_detect_languages(texts)] == [
+            r.model_dump() for r in validated.batch_detect_languages(texts)
+        ]
+
+    @pytest.mark.parametrize('trusted', (True, False))
+    def test_malformed_response(self, trusted):
+
+        detector = AWSLanguageDetector(FakeComprehendClient(), trusted=trusted)
+
+        with pytest.raises(DetectorDataError):
+            detector.validate_response(AWSBatchLangsModel, [{'Index': 0}])
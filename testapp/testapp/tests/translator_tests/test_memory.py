@@ -0,0 +1,34 @@
+import pytest
+
+from extends.memory.models import TranslationMemory
+from extends.memory.translators import MemoryTranslator, memorized
+
+
+@pytest.mark.django_db(transaction=True)
+class TestMemoryTranslator:
+
+    def test_memory_shared_between_translators(self, fake_translator):
+
+        first = MemoryTranslator(fake_translator).translate_text('Yes', 'ru')
+        # New translator instance imitates another worker process.
+        second = MemoryTranslator(fake_translator).translate_text('Yes', 'ru')
+
+        assert first.text == second.text, 'Memory must return stored translation.'
+        assert fake_translator.calls == [('Yes', 'ru')], (
+            f'Stored text must not be translated again, calls {fake_translator.calls}'
+        )
+        assert TranslationMemory.objects.count() == 1, 'Translation must be stored once.'
+
+    def test_bulk_lookup(self, fake_translator, django_assert_num_queries):
+
+        translator = memorized(lambda: fake_translator)()
+        for text in ('Yes', 'No'):
+            translator.translate_text(text, 'de')
+
+        with django_assert_num_queries(1):
+            found = TranslationMemory.objects.lookup(['Yes', 'No', 'Maybe'], 'de')
+
+        assert set(found) == {'Yes', 'No'}, f'Bulk lookup found wrong texts {set(found)}'
+        assert not TranslationMemory.objects.lookup(['Yes'], 'ru'), (
+            'Lookup key must contain target language.'
+        )
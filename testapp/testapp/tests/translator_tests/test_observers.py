@@ -0,0 +1,68 @@
+import pytest
+
+from extends.observers import StatsObserver, register_observer, unregister_observer
+from extends.opportunity import CachedTranslator, DeeplTranslator
+from extends.opportunity.exceptions import TranslatorConnectionError
+from testapp.models import Question
+
+
+@pytest.fixture
+def stats():
+
+    observer = register_observer(StatsObserver())
+    yield observer
+    unregister_observer(observer)
+
+
+class TestStatsObserver:
+
+    def test_deepl_request_reported(self, stats, fake_deepl_client):
+
+        translator = DeeplTranslator(fake_deepl_client)
+        translator.translate_text('hello', 'ru')
+        translator.translate_texts(['a', 'bc'], 'de')
+
+        (row,) = stats.rows()
+        assert (row['kind'], row['calls'], row['chars'], row['errors']) == (
+            'translate', 2, 8, 0
+        ), f'Wrong translate stats {row}'
+
+    def test_failed_request_reported(self, stats, fake_deepl_client):
+
+        from deepl.exceptions import ConnectionException
+
+        def fail(*args, **kwargs):
+            raise ConnectionException('down')
+
+        fake_deepl_client.translate_text = fail
+        with pytest.raises(TranslatorConnectionError):
+            DeeplTranslator(fake_deepl_client).translate_text('hello', 'ru')
+
+        assert stats.rows()[0]['errors'] == 1, 'Failed request must be counted as error.'
+
+    def test_setter_reports_model_field_and_cache(self, stats, monkeypatch, fake_translator):
+
+        monkeypatch.setattr(Question.question, 'converter', CachedTranslator(fake_translator))
+        Question(question='hello')
+        Question(question='hello')
+
+        rows = {row['kind']: row for row in stats.rows()}
+        assert set(rows) == {'setter', 'cache'}, f'Unexpected events {rows}'
+        assert (rows['cache']['model'], rows['cache']['field']) == ('Question', 'question'), (
+            'Translator events must get model and field from setter context.'
+        )
+        suffixes = len(Question.question.auto.suffix)
+        assert (rows['cache']['hits'], rows['cache']['misses']) == (suffixes, suffixes)
+        assert rows['setter']['calls'] == 2
+        assert 'Question' in stats.table()
+
+    def test_no_events_without_observers(self, fake_deepl_client):
+
+        from extends.observers import _noop, observe
+
+        observer = register_observer(StatsObserver())
+        unregister_observer(observer)
+        DeeplTranslator(fake_deepl_client).translate_text('hello', 'ru')
+
+        assert observer.rows() == [], 'Unregistered observer must not get events.'
+        assert observe('translate') is _noop, 'Empty registry must take no-op path.'
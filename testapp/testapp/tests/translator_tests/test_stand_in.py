@@ -0,0 +1,87 @@
+import pytest
+
+from extends.opportunity import (
+    Simulation,
+    Recording,
+    StandInTranslator,
+    StandInDetector,
+    RecordingTranslator,
+    get_translator,
+    get_detector,
+)
+from extends.opportunity.exceptions import (
+    TranslatorConnectionError,
+    TranslatorDataError,
+    TranslatorThrottleError,
+)
+
+
+class TestSimulation:
+
+    def test_same_seed_same_failures(self):
+
+        def outcomes(seed):
+            translator = StandInTranslator(
+                Simulation(error_rate=0.3, throttle_rate=0.2, seed=seed, sleep=lambda s: None)
+            )
+            result = []
+            for _ in range(50):
+                try:
+                    translator.translate_text('hi', 'ru')
+                    result.append('ok')
+                except TranslatorThrottleError:
+                    result.append('throttle')
+                except TranslatorConnectionError:
+                    result.append('error')
+            return result
+
+        first = outcomes(1)
+        assert first == outcomes(1), 'Simulation with the same seed must be deterministic.'
+        assert {'ok', 'throttle', 'error'} == set(first), f'Unexpected outcomes {set(first)}'
+
+    def test_latency_distribution(self):
+
+        delays = []
+        simulation = Simulation(latency=('uniform', 0.01, 0.02), seed=1, sleep=delays.append)
+        StandInTranslator(simulation).translate_texts(['a', 'b', 'c'], 'ru')
+
+        assert len(delays) == 1, 'Batch must be one simulated request.'
+        assert 0.01 <= delays[0] <= 0.02
+
+    def test_unknown_distribution(self):
+
+        with pytest.raises(ValueError):
+            Simulation(latency=('pareto', 1))
+
+
+class TestRecordReplay:
+
+    def test_translation_replay(self, tmp_path, fake_translator):
+
+        path = tmp_path / 'responses.json'
+        recorder = RecordingTranslator(fake_translator, Recording(path))
+        recorder.translate_texts(['hello', 'bye'], 'ru')
+        recorder.recording.save()
+
+        replay = StandInTranslator(recording=path, strict=True)
+        assert replay.translate_text('bye', 'ru').text == 'bye [ru]'
+        with pytest.raises(TranslatorDataError):
+            replay.translate_text('bye', 'de')
+
+    def test_pseudo_detection(self):
+
+        detector = StandInDetector()
+        results = detector.batch_detect_languages(['hello', 'привет'])
+
+        assert [r.languages[0].language for r in results] == ['en', 'ru']
+
+
+class TestSettings:
+
+    def test_factories_return_stand_in(self, settings, monkeypatch):
+
+        monkeypatch.delenv('DEEPL_TRANSLATOR_KEY', raising=False)
+        settings.EXTENDS_STAND_IN = {'translator': {'latency': 0, 'seed': 1}, 'detector': {}}
+
+        assert isinstance(get_translator(), StandInTranslator)
+        assert isinstance(get_detector(), StandInDetector)
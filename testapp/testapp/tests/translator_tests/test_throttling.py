@@ -0,0 +1,122 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+from deepl.exceptions import TooManyRequestsException, ConnectionException
+
+from extends.opportunity import DeeplTranslator, TokenBucket, RateLimiter, Backoff, QuotaGuard
+from extends.opportunity.exceptions import TranslatorQuotaError, TranslatorThrottleError
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FlakyClient:
+    """Deepl client which fails with given exceptions before answering."""
+
+    def __init__(self, client, errors):
+        self.client = client
+        self.errors = list(errors)
+        self.calls = 0
+
+    def translate_text(self, text, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.client.translate_text(text, **kwargs)
+
+
+def usage(count, limit):
+    return SimpleNamespace(character=SimpleNamespace(count=count, limit=limit))
+
+
+class TestRateLimiter:
+
+    def test_bucket_waits_for_tokens(self):
+
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, timer=clock, sleep=clock.sleep)
+        for _ in range(4):
+            bucket.acquire()
+
+        assert clock.sleeps == [0.5, 0.5], f'Unexpected waits {clock.sleeps}'
+
+    def test_characters_per_minute(self):
+
+        clock = FakeClock()
+        limiter = RateLimiter(characters_per_minute=600, timer=clock, sleep=clock.sleep)
+        limiter.acquire(600)
+        limiter.acquire(100)
+
+        assert clock.sleeps == [10.0], f'Unexpected waits {clock.sleeps}'
+
+    def test_translator_uses_limiter(self, fake_deepl_client):
+
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_second=1, timer=clock, sleep=clock.sleep)
+        translator = DeeplTranslator(fake_deepl_client, rate_limiter=limiter)
+        translator.translate_text('a', 'ru')
+        translator.translate_text('b', 'ru')
+
+        assert clock.sleeps == [1.0]
+
+
+class TestBackoff:
+
+    def test_retry_throttled_request(self, fake_deepl_client):
+
+        sleeps = []
+        client = FlakyClient(
+            fake_deepl_client, [TooManyRequestsException('429'), ConnectionException('down')]
+        )
+        backoff = Backoff(retries=3, base=1, rng=random.Random(1), sleep=sleeps.append)
+        result = DeeplTranslator(client, backoff=backoff).translate_text('a', 'ru')
+
+        assert result.text == 'a [RU]'
+        assert client.calls == 3
+        assert len(sleeps) == 2 and 0 <= sleeps[0] <= 1 and 0 <= sleeps[1] <= 2, sleeps
+
+    def test_give_up_after_retries(self, fake_deepl_client):
+
+        client = FlakyClient(fake_deepl_client, [TooManyRequestsException('429')] * 3)
+        backoff = Backoff(retries=1, sleep=lambda s: None)
+
+        with pytest.raises(TranslatorThrottleError):
+            DeeplTranslator(client, backoff=backoff).translate_text('a', 'ru')
+        assert client.calls == 2
+
+
+class TestQuotaGuard:
+
+    def test_usage_cached_and_counted_locally(self, fake_deepl_client):
+
+        clock = FakeClock()
+        lookups = []
+
+        def get_usage():
+            lookups.append(clock.now)
+            return usage(90, 100)
+
+        quota = QuotaGuard(get_usage, ttl=60, timer=clock)
+        translator = DeeplTranslator(fake_deepl_client, quota=quota)
+        translator.translate_text('12345', 'ru')
+
+        with pytest.raises(TranslatorQuotaError):
+            translator.translate_text('123456', 'ru')
+        assert len(lookups) == 1, 'Usage must be requested once per ttl.'
+        assert len(fake_deepl_client.requests) == 1, 'Request over quota must not be sent.'
+
+        clock.now = 61
+        translator.translate_text('1234', 'ru')
+        assert len(lookups) == 2